@@ -4,23 +4,32 @@ Outil d'automatisation de peche pour Minecraft avec simulation de comportement h
 """
 
 import time
-import random
+import queue
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox
-
-# Configuration du logging
+from logging.handlers import QueueHandler, QueueListener
+
+# Configuration du logging: les threads (clics, audio) ne font que deposer
+# les enregistrements dans une file, ecrite sur la console par un listener
+_log_queue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+log_listener = QueueListener(_log_queue, _console_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(message)s'
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
+log_listener.start()
 
 # Imports des modules locaux
 from src import (
     load_config,
     save_config,
     get_running_applications,
+    invalidate_meter_cache,
     get_process_id_by_name,
     bring_window_to_front,
     HumanProfile,
@@ -36,6 +45,42 @@ from src.overlay_manager import OverlayManager
 from src.ui_builder import UIBuilder
 
 
+# Intervalle de vidage de la file des niveaux de volume (~30 fps)
+VOLUME_DRAIN_MS = 33
+
+# Boucle periodique de l'interface (verification d'inactivite a chaque
+# passage) et cadence de la sauvegarde auto
+TICK_MS = 1000
+AUTO_SAVE_TICKS = 30       # 30 s
+
+# Periode de scrutation de l'enumeration des applications (thread Tk)
+APPS_POLL_MS = 50
+
+# Delai de regroupement des sauvegardes de configuration
+CONFIG_SAVE_DELAY_MS = 500
+
+# Rafraichissement des statistiques dependant du temps (duree, clics/min)
+STATS_REFRESH_MS = 5000
+STATS_HIDDEN_REFRESH_MS = 15000   # fenetre reduite
+
+# Resume affiche dans l'onglet des profils
+PROFILE_DISPLAY_TEMPLATE = (
+    "Profil: {p.name}\n\n"
+    "Vitesse: {p.reaction_speed:.1f}\n"
+    "Consistance: {p.consistency:.1f}\n"
+    "Fatigue: {p.fatigue_rate:.1f}\n"
+    "Concentration: {p.concentration_level:.1f}\n"
+    "Variation: {p.rhythm_variation:.1f}"
+)
+
+# Profils predefinis (instances partagees, jamais modifiees)
+PRESET_PROFILES = {
+    'fast': HumanProfile("Fast", 1.5, 0.7, 0.3, 0.8, 0.3),
+    'normal': HumanProfile("Normal", 1.0, 0.5, 0.5, 0.6, 0.5),
+    'slow': HumanProfile("Slow", 0.7, 0.3, 0.7, 0.4, 0.7),
+}
+
+
 class AutoFishApp(tk.Tk):
     """
     Application principale d'automatisation de peche.
@@ -43,7 +88,7 @@ class AutoFishApp(tk.Tk):
     Orchestre les differents composants:
     - AppState: Gestion de l'etat
     - ClickHandler: Execution des clics
-    - Monitors: Surveillance volume/inactivite
+    - Monitors: Surveillance volume (thread) et inactivite (boucle Tk)
     - KeyboardHandler: Raccourcis clavier
     - OverlayManager: Fenetres overlay
     - UIBuilder: Interface utilisateur
@@ -71,6 +116,26 @@ class AutoFishApp(tk.Tk):
         # Etat de l'application
         self.state = AppState()
 
+        # Niveaux de volume produits par le thread de monitoring
+        self._volume_queue = queue.Queue()
+
+        # Sauvegarde differee de la configuration
+        self._config_dirty = False
+        self._config_save_job = None
+        # Ecritures disque (encodage JSON + remplacement atomique) hors du thread Tk
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autofish-io")
+        # Enumeration des applications en cours (resultat lu par le thread Tk)
+        self._apps_future = None
+
+        # Fenetre de calibration, creee au premier usage puis masquee/reaffichee
+        self.calibration_window = None
+
+        # Statistiques de session: recalculees seulement apres un changement
+        self._stats_dirty = True
+        self._stats_idle_job = None
+        self._session_stats_values = {}
+        self._last_stats_key = None
+
         # Profil humain
         self._init_human_profile()
 
@@ -83,7 +148,7 @@ class AutoFishApp(tk.Tk):
             state=self.state,
             randomizer=self.randomizer,
             stats_manager=self.stats_manager,
-            on_click_callback=self._on_click_performed
+            on_click_callback=self._on_tk_thread(self._on_click_performed)
         )
 
         # Gestionnaire d'overlay
@@ -95,13 +160,14 @@ class AutoFishApp(tk.Tk):
         self.overlay.create()
 
         # Gestionnaire de clavier
+        # Les callbacks du listener pynput sont reportes sur le thread Tk
         self.keyboard_handler = KeyboardHandler(
             state=self.state,
-            on_toggle_pause=self.toggle_pause,
-            on_toggle_disable=self.toggle_disable,
-            on_temp_pause=self.start_temp_pause,
-            on_test_click=self.test_click,
-            on_state_change=self._update_indicator
+            on_toggle_pause=self._on_tk_thread(self.toggle_pause),
+            on_toggle_disable=self._on_tk_thread(self.toggle_disable),
+            on_temp_pause=self._on_tk_thread(self.start_temp_pause),
+            on_test_click=self._on_tk_thread(self.test_click),
+            on_state_change=self._on_tk_thread(self._update_indicator)
         )
         self.keyboard_handler.start()
 
@@ -109,18 +175,19 @@ class AutoFishApp(tk.Tk):
         self.volume_monitor = VolumeMonitor(
             state=self.state,
             calibrator=self.auto_calibrator,
-            on_trigger=self.click_handler.perform_double_right_click,
+            on_trigger=self.click_handler.request_double_click,
             on_volume_update=self._on_volume_update
         )
 
         self.inactivity_monitor = InactivityMonitor(
             state=self.state,
             calibrator=self.auto_calibrator,
-            on_inactivity=self.click_handler.perform_single_right_click
+            on_inactivity=self.click_handler.request_single_click
         )
 
         self.temp_pause_monitor = TempPauseMonitor(
             state=self.state,
+            scheduler=self,
             on_pause_end=self._update_indicator
         )
 
@@ -133,6 +200,16 @@ class AutoFishApp(tk.Tk):
             self.human_profile = HumanProfile.generate_random("Default")
 
         self.randomizer = HumanLikeRandomizer(self.human_profile)
+        self._profile_dict = self.human_profile.to_dict()
+
+    def _apply_human_profile(self, profile: HumanProfile):
+        """Active un nouveau profil humain (randomizer et copie serialisee)."""
+        self.human_profile = profile
+        self._profile_dict = profile.to_dict()
+        self.randomizer = HumanLikeRandomizer(profile)
+        self.click_handler.randomizer = self.randomizer
+        self._update_profile_display()
+        self.request_config_save()
 
     def _build_interface(self):
         """Construit l'interface utilisateur."""
@@ -147,7 +224,8 @@ class AutoFishApp(tk.Tk):
             'set_preset': self.set_preset_profile,
             'toggle_boost': self.toggle_boost,
             'reset_counter': self.reset_counter,
-            'save_config': self.save_current_config,
+            'save_config': self.request_config_save,
+            'update_text_color': self.overlay.update_text_color,
         }
 
         self.ui = UIBuilder(self, self.state, callbacks)
@@ -166,13 +244,11 @@ class AutoFishApp(tk.Tk):
         self._start_periodic_updates()
 
     def _start_monitors(self):
-        """Demarre tous les threads de monitoring."""
+        """Demarre le thread audio et la boucle periodique de l'interface."""
         self.volume_monitor.start()
-        self.inactivity_monitor.start()
-        self.temp_pause_monitor.start()
 
-        # Thread de sauvegarde auto
-        threading.Thread(target=self._auto_save_loop, daemon=True).start()
+        self._tick_count = 0
+        self.after(TICK_MS, self._tick)
 
     def _setup_closing(self):
         """Configure la gestion de la fermeture."""
@@ -180,19 +256,42 @@ class AutoFishApp(tk.Tk):
 
     # === Callbacks ===
 
+    def _on_tk_thread(self, callback):
+        """Retourne une version de `callback` executee par la boucle Tk via after(0)."""
+        def schedule(*args):
+            self.after(0, callback, *args)
+        return schedule
+
     def _on_click_performed(self, display_line: str):
-        """Callback appele apres chaque clic."""
+        """Callback appele (sur le thread Tk) apres chaque clic."""
         self.overlay.update_delay_text(display_line)
-        self.save_current_config()
+        # Le compteur est ecrit par la sauvegarde periodique (ou a la fermeture)
+        self._config_dirty = True
+        self._mark_stats_dirty()
 
     def _on_volume_update(self, level: float):
-        """Callback pour mise a jour du volume."""
-        self.ui.update_volume_display(level)
+        """Callback pour mise a jour du volume (thread de monitoring)."""
+        self._volume_queue.put(level)
+
+    def _drain_volume_queue(self):
+        """Transfere les niveaux de volume en attente vers l'interface."""
+        levels = []
+        try:
+            while True:
+                levels.append(self._volume_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if levels:
+            self.ui.add_volume_samples(levels)
+
+        self.after(VOLUME_DRAIN_MS, self._drain_volume_queue)
 
     def _on_threshold_change(self, value):
         """Callback pour changement de seuil."""
         self.state.detection.threshold = float(value)
         self.ui.update_threshold_display(self.state.detection.threshold)
+        self.request_config_save()
 
     def _on_delays_change(self, value):
         """Callback pour changement de delais."""
@@ -206,14 +305,15 @@ class AutoFishApp(tk.Tk):
         self.state.detection.min_delay = min_delay
         self.state.detection.max_delay = max_delay
         self.ui.update_delay_display(min_delay, max_delay)
+        self.request_config_save()
 
     def _on_inactivity_change(self, value):
         """Callback pour changement d'inactivite."""
         base = int(float(value))
         self.state.inactivity.base_delay = base
-        self.state.inactivity.current_delay = random.uniform(base - 2, base + 2)
+        self.state.randomize_inactivity_delay()
         self.ui.update_inactivity_display(base)
-        self.save_current_config()
+        self.request_config_save()
 
     def _update_indicator(self):
         """Met a jour l'indicateur d'etat."""
@@ -222,8 +322,34 @@ class AutoFishApp(tk.Tk):
     # === Actions utilisateur ===
 
     def refresh_applications(self):
-        """Rafraichit la liste des applications."""
-        apps = get_running_applications()
+        """
+        Rafraichit la liste des applications.
+
+        L'enumeration des sessions audio s'execute sur le thread
+        d'entrees/sorties, qui ne touche pas a Tkinter: le thread Tk
+        scrute le resultat via after(). Un rafraichissement deja en
+        cours absorbe les demandes suivantes.
+        """
+        if self._apps_future is not None:
+            return
+        self._apps_future = self._io_pool.submit(get_running_applications)
+        self.after(APPS_POLL_MS, self._poll_applications)
+
+    def _poll_applications(self):
+        """Affiche la liste des applications une fois l'enumeration terminee (thread Tk)."""
+        future = self._apps_future
+        if not future.done():
+            self.after(APPS_POLL_MS, self._poll_applications)
+            return
+
+        try:
+            apps = future.result()
+        except Exception:
+            logging.exception("Erreur lors de l'enumeration des applications")
+            return
+        finally:
+            self._apps_future = None
+
         self.ui.update_apps_list(apps)
         logging.info(f"Applications trouvees: {apps}")
 
@@ -232,32 +358,35 @@ class AutoFishApp(tk.Tk):
         app_name = self.ui.app_var.get()
         if not app_name:
             return
+        # Re-selection de l'application deja active (PID connu): rien a faire
+        if app_name == self.state.selected_app and self.state.app_pid:
+            return
 
+        invalidate_meter_cache(app_name)
         self.state.app_pid = get_process_id_by_name(app_name)
         if self.state.app_pid:
             self.state.selected_app = app_name
-            self.save_current_config()
+            self.request_config_save()
             logging.info(f"Application selectionnee: {app_name} (PID: {self.state.app_pid})")
 
     def toggle_pause(self):
         """Bascule l'etat de pause."""
         self.state.is_paused = not self.state.is_paused
         self.state.reset_inactivity()
-        self.save_current_config()
+        self.request_config_save()
         self._update_indicator()
         logging.info(f"Etat: {'En pause' if self.state.is_paused else 'Actif'}")
 
     def toggle_disable(self):
         """Bascule l'etat completement desactive."""
         self.state.is_completely_disabled = not self.state.is_completely_disabled
-        self.save_current_config()
+        self.request_config_save()
         self._update_indicator()
         logging.info(f"Etat: {'Desactive' if self.state.is_completely_disabled else 'Active'}")
 
     def start_temp_pause(self, seconds: int):
         """Demarre une pause temporaire."""
-        self.state.temp_pause_remaining = seconds
-        self.state.temp_pause_start = time.time()
+        self.temp_pause_monitor.start(seconds)
         self._update_indicator()
         logging.info(f"Pause temporaire de {seconds} secondes")
 
@@ -265,60 +394,37 @@ class AutoFishApp(tk.Tk):
         """Active/desactive le mode boost."""
         self.state.is_boost_mode = not self.state.is_boost_mode
         self.ui.update_boost_button(self.state.is_boost_mode)
-        self.save_current_config()
+        self.request_config_save()
         logging.info(f"Mode Boost: {self.state.is_boost_mode}")
 
     def reset_counter(self):
         """Reinitialise le compteur de clics."""
         if messagebox.askyesno("Reset", "Reinitialiser le compteur ?"):
             self.state.click_counter = 0
-            self.state.click_timestamps.clear()
-            self.save_current_config()
+            self.state.reset_click_timestamps()
+            self.request_config_save()
+            self._mark_stats_dirty()
             logging.info("Compteur reinitialise")
 
     def test_click(self):
         """Effectue un clic de test."""
-        threading.Thread(
-            target=self.click_handler.perform_single_right_click,
-            daemon=True
-        ).start()
+        self.click_handler.request_single_click()
 
     # === Profils ===
 
     def generate_new_profile(self):
         """Genere un nouveau profil aleatoire."""
-        self.human_profile = HumanProfile.generate_random("Random")
-        self.randomizer = HumanLikeRandomizer(self.human_profile)
-        self.click_handler.randomizer = self.randomizer
-        self._update_profile_display()
-        self.save_current_config()
+        self._apply_human_profile(HumanProfile.generate_random("Random"))
 
     def set_preset_profile(self, preset: str):
         """Applique un profil predefini."""
-        profiles = {
-            'fast': HumanProfile("Fast", 1.5, 0.7, 0.3, 0.8, 0.3),
-            'normal': HumanProfile("Normal", 1.0, 0.5, 0.5, 0.6, 0.5),
-            'slow': HumanProfile("Slow", 0.7, 0.3, 0.7, 0.4, 0.7)
-        }
-
-        if preset in profiles:
-            self.human_profile = profiles[preset]
-            self.randomizer = HumanLikeRandomizer(self.human_profile)
-            self.click_handler.randomizer = self.randomizer
-            self._update_profile_display()
-            self.save_current_config()
+        profile = PRESET_PROFILES.get(preset)
+        if profile:
+            self._apply_human_profile(profile)
 
     def _update_profile_display(self):
-        """Met a jour l'affichage du profil."""
-        text = (
-            f"Profil: {self.human_profile.name}\n\n"
-            f"Vitesse: {self.human_profile.reaction_speed:.1f}\n"
-            f"Consistance: {self.human_profile.consistency:.1f}\n"
-            f"Fatigue: {self.human_profile.fatigue_rate:.1f}\n"
-            f"Concentration: {self.human_profile.concentration_level:.1f}\n"
-            f"Variation: {self.human_profile.rhythm_variation:.1f}"
-        )
-        self.ui.profile_label.config(text=text)
+        """Met a jour l'affichage du profil (ignore si le texte est inchange)."""
+        self.ui.update_profile_display(PROFILE_DISPLAY_TEMPLATE.format(p=self.human_profile))
 
     # === Calibration ===
 
@@ -337,21 +443,33 @@ class AutoFishApp(tk.Tk):
 
         self._show_calibration_window()
 
+        # Callbacks appeles depuis le thread de monitoring du volume
         self.auto_calibrator.start_calibration(
-            self._on_calibration_complete,
-            self._update_calibration_progress
+            self._on_tk_thread(self._on_calibration_complete),
+            self._on_tk_thread(self._update_calibration_progress)
         )
 
         self.ui.calibration_button.config(state='disabled')
 
     def _show_calibration_window(self):
-        """Affiche la fenetre de calibration."""
+        """Affiche la fenetre de calibration (creee une fois, puis reutilisee)."""
+        if self.calibration_window is None:
+            self._create_calibration_window()
+
+        self.calibration_progress_var.set(0)
+        self.calibration_time_var.set("Temps restant: 30s")
+        self.calibration_window.deiconify()
+        self.calibration_window.lift()
+
+    def _create_calibration_window(self):
+        """Cree la fenetre de calibration."""
         self.calibration_window = tk.Toplevel(self)
         self.calibration_window.title("Auto-Calibration en cours")
         self.calibration_window.geometry("400x200")
         self.calibration_window.configure(bg='#f0f0f0')
         self.calibration_window.resizable(False, False)
         self.calibration_window.attributes("-topmost", True)
+        self.calibration_window.protocol("WM_DELETE_WINDOW", self._cancel_calibration)
 
         tk.Label(
             self.calibration_window, text="AUTO-CALIBRATION",
@@ -387,21 +505,21 @@ class AutoFishApp(tk.Tk):
 
     def _update_calibration_progress(self, progress: int, remaining: float):
         """Met a jour la progression de la calibration."""
-        if hasattr(self, 'calibration_window') and self.calibration_window.winfo_exists():
+        if self.calibration_window is not None and self.auto_calibrator.is_calibrating:
             self.calibration_progress_var.set(progress)
             self.calibration_time_var.set(f"Temps restant: {int(remaining)}s")
 
     def _cancel_calibration(self):
         """Annule la calibration."""
         self.auto_calibrator.cancel()
-        if hasattr(self, 'calibration_window'):
-            self.calibration_window.destroy()
+        if self.calibration_window is not None:
+            self.calibration_window.withdraw()
         self.ui.calibration_button.config(state='normal')
 
     def _on_calibration_complete(self, optimal_threshold):
         """Callback quand la calibration est terminee."""
-        if hasattr(self, 'calibration_window'):
-            self.calibration_window.destroy()
+        if self.calibration_window is not None:
+            self.calibration_window.withdraw()
 
         self.ui.calibration_button.config(state='normal')
 
@@ -409,7 +527,7 @@ class AutoFishApp(tk.Tk):
             self.state.detection.threshold = optimal_threshold
             self.ui.threshold_scale.set(optimal_threshold)
             self.ui.update_threshold_display(optimal_threshold)
-            self.save_current_config()
+            self.request_config_save()
 
             messagebox.showinfo(
                 "Calibration Reussie",
@@ -424,62 +542,152 @@ class AutoFishApp(tk.Tk):
     def _start_periodic_updates(self):
         """Demarre les mises a jour periodiques."""
         self._update_stats_display()
+        self._drain_volume_queue()
 
     def _update_stats_display(self):
-        """Met a jour l'affichage des statistiques."""
+        """Rafraichit periodiquement les statistiques dependant du temps."""
+        # `self.state` designe l'AppState: l'etat de la fenetre passe par wm_state
+        if self.wm_state() == 'iconic':
+            self.after(STATS_HIDDEN_REFRESH_MS, self._update_stats_display)
+            return
+
+        self._render_stats()
+        self.after(STATS_REFRESH_MS, self._update_stats_display)
+
+    def _mark_stats_dirty(self):
+        """Signale un changement des statistiques; l'affichage suit au repos de Tk."""
+        self._stats_dirty = True
+        if self._stats_idle_job is None:
+            self._stats_idle_job = self.after_idle(self._flush_stats)
+
+    def _flush_stats(self):
+        """Affiche les statistiques modifiees depuis le dernier rendu."""
+        self._stats_idle_job = None
+        self._render_stats()
+
+    def _render_stats(self):
+        """
+        Met a jour l'affichage des statistiques.
+
+        Les statistiques de session ne sont recalculees qu'apres un clic ou
+        une remise a zero; la duree et le rythme le sont a chaque rendu.
+        """
         runtime = time.time() - self.state.start_time
         hours = int(runtime // 3600)
         minutes = int((runtime % 3600) // 60)
 
-        recent_clicks = [t for t in self.state.click_timestamps if time.time() - t < 60]
-        cpm = len(recent_clicks)
+        cpm = self.state.get_clicks_per_minute(time.monotonic())
 
-        session_stats = self.stats_manager.get_session_stats()
-
-        text = f"""========================================
-         STATISTIQUES AVANCEES
-========================================
+        # Rien a afficher si aucune valeur n'a change depuis le dernier rendu
+        key = (self.state.click_counter, hours, minutes, cpm)
+        if key == self._last_stats_key and not self._stats_dirty:
+            return
+        self._last_stats_key = key
+
+        if self._stats_dirty:
+            self._stats_dirty = False
+            session_stats = self.stats_manager.get_session_stats()
+            self._session_stats_values = {
+                'success_rate': f"{session_stats['success_rate']:.1f}%",
+                'best_hour': session_stats['best_hour'],
+                'pattern': session_stats['most_used_pattern'],
+                'avg_reaction': f"{session_stats['avg_reaction']:.3f}s",
+                'total_clicks': f"{session_stats['clicks']} clics",
+            }
+
+        self.ui.update_stats_display({
+            'fish': str(self.state.click_counter),
+            'session_time': f"{hours}h{minutes:02d}",
+            'rate': f"{cpm} /min",
+            **self._session_stats_values,
+        })
+
+    def _tick(self):
+        """Boucle periodique: inactivite et sauvegarde auto (si modifiee)."""
+        if not self.state.is_running:
+            return
 
-Poissons peches: {self.state.click_counter}
-Temps session: {hours}h{minutes:02d}
-Taux actuel: {cpm} /min
-Taux succes: {session_stats['success_rate']:.1f}%
+        self._tick_count += 1
 
-Meilleure heure: {session_stats['best_hour']}
-Pattern favori: {session_stats['most_used_pattern']}
-Reaction moy: {session_stats['avg_reaction']:.3f}s
-Total historique: {session_stats['clicks']} clics"""
+        self.inactivity_monitor.check()
 
-        self.ui.stats_text.delete(1.0, tk.END)
-        self.ui.stats_text.insert(1.0, text)
+        if self._tick_count % AUTO_SAVE_TICKS == 0 and self._config_dirty:
+            self.save_current_config()
 
-        self.after(5000, self._update_stats_display)
+        self.after(TICK_MS, self._tick)
 
     # === Sauvegarde ===
 
+    def request_config_save(self):
+        """
+        Demande une sauvegarde de la configuration.
+
+        Les demandes rapprochees (curseurs, cases a cocher) sont regroupees
+        en une seule ecriture CONFIG_SAVE_DELAY_MS plus tard.
+        """
+        self._config_dirty = True
+        if self._config_save_job is None:
+            self._config_save_job = self.after(CONFIG_SAVE_DELAY_MS, self._flush_config)
+
+    def _flush_config(self):
+        """Ecrit la configuration si une sauvegarde est en attente."""
+        self._config_save_job = None
+        if self._config_dirty:
+            self.save_current_config()
+
     def save_current_config(self):
-        """Sauvegarde la configuration actuelle."""
-        config = self.state.to_config_dict()
-        config["human_profile"] = self.human_profile.to_dict()
-        save_config(config)
+        """
+        Sauvegarde la configuration actuelle.
+
+        Le dictionnaire est construit sur le thread Tk; l'encodage et
+        l'ecriture sont confies au thread d'entrees/sorties.
+        """
+        self._config_dirty = False
+        self._io_pool.submit(save_config, self._current_config()).add_done_callback(
+            self._log_io_error
+        )
 
-    def _auto_save_loop(self):
-        """Boucle de sauvegarde automatique."""
-        while self.state.is_running:
-            time.sleep(30)
-            self.save_current_config()
+    def _current_config(self) -> dict:
+        """Construit le dictionnaire de configuration (thread Tk)."""
+        config = self.state.to_config_dict()
+        config["human_profile"] = self._profile_dict
+        return config
+
+    @staticmethod
+    def _log_io_error(future):
+        """Journalise l'exception d'une tache du thread d'entrees/sorties."""
+        # Tache abandonnee a la fermeture: remplacee par l'ecriture finale
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logging.error(
+                "Erreur lors de la sauvegarde de la config",
+                exc_info=(type(error), error, error.__traceback__)
+            )
 
     # === Fermeture ===
 
     def on_closing(self):
         """Gestion de la fermeture de l'application."""
-        self.save_current_config()
+        if self._config_save_job is not None:
+            self.after_cancel(self._config_save_job)
+            self._config_save_job = None
+        # Ne pas attendre une enumeration en cours: les taches en attente
+        # sont abandonnees et la derniere ecriture est faite ici
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._config_dirty = False
+        save_config(self._current_config())
+        self.stats_manager.flush()
         self.state.is_running = False
 
+        # Arret des threads, chacun attendu au plus une fraction de seconde
         self.keyboard_handler.stop()
+        self.volume_monitor.stop()
+        self.click_handler.stop()
+        self.temp_pause_monitor.cancel()
         self.overlay.destroy()
 
-        time.sleep(0.5)
         self.destroy()
         logging.info("Application fermee")
 
@@ -503,6 +711,9 @@ def main():
         traceback.print_exc()
         input("Appuyez sur Entree pour fermer...")
 
+    finally:
+        log_listener.stop()
+
 
 if __name__ == "__main__":
     main()
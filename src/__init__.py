@@ -6,6 +6,7 @@ from .config_manager import load_config, save_config
 from .audio_processing import (
     get_running_applications,
     get_app_volume,
+    invalidate_meter_cache,
     volume_to_db,
     db_to_normalized_scale
 )
@@ -13,11 +14,18 @@ from .window_management import (
     get_process_id_by_name,
     is_application_in_foreground,
     get_hwnds_for_pid,
+    invalidate_hwnd_cache,
     bring_window_to_front
 )
-from .human_behavior import HumanProfile, HumanLikeRandomizer
+from .human_behavior import (
+    HumanProfile,
+    HumanLikeRandomizer,
+    FLAG_URGENT,
+    FLAG_LONG_REPETITION,
+    FLAG_BOOST
+)
 from .stats_manager import StatsManager
-from .calibration import AutoCalibrator
+from .calibration import AutoCalibrator, compute_optimal_threshold
 from .ui_components import (
     VolumeGraphBar,
     COLORS_MAP,
@@ -40,20 +48,26 @@ __all__ = [
     # audio_processing
     'get_running_applications',
     'get_app_volume',
+    'invalidate_meter_cache',
     'volume_to_db',
     'db_to_normalized_scale',
     # window_management
     'get_process_id_by_name',
     'is_application_in_foreground',
     'get_hwnds_for_pid',
+    'invalidate_hwnd_cache',
     'bring_window_to_front',
     # human_behavior
     'HumanProfile',
     'HumanLikeRandomizer',
+    'FLAG_URGENT',
+    'FLAG_LONG_REPETITION',
+    'FLAG_BOOST',
     # stats_manager
     'StatsManager',
     # calibration
     'AutoCalibrator',
+    'compute_optimal_threshold',
     # ui_components
     'VolumeGraphBar',
     'COLORS_MAP',
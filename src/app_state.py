@@ -3,11 +3,12 @@ AutoFish Minecraft - Gestion de l'etat de l'application.
 """
 
 import time
-import random
+import threading
 import collections
 import tkinter as tk
+import numpy as np
 from dataclasses import dataclass, field
-from typing import Optional, Deque
+from typing import Optional, Deque, List
 
 from .config_manager import load_config
 
@@ -47,6 +48,15 @@ class AppState:
     Gere toutes les variables d'etat, les compteurs et les flags.
     """
 
+    # Nombre d'echantillons pris en compte pour la baseline du volume
+    VOLUME_HISTORY_SIZE = 10
+
+    # Fenetre du calcul du taux de clics (secondes)
+    RATE_WINDOW = 60
+
+    # Taille du lot de variations pre-tirees du delai d'inactivite
+    INACTIVITY_JITTER_POOL_SIZE = 1024
+
     def __init__(self):
         """Initialise l'etat de l'application depuis la configuration."""
         self.config = load_config()
@@ -73,12 +83,13 @@ class AppState:
             post_action_delay=self.config.get("post_action_delay", 0.75)
         )
 
-        # Inactivite
+        # Inactivite (variations de +/-2 s tirees par lots)
+        self._jitter_rng = np.random.default_rng()
+        self._jitter_pool: List[float] = []
+        self._jitter_index = 0
         inactivity_base = self.config.get("inactivity_base", 7)
-        self.inactivity = InactivityParams(
-            base_delay=inactivity_base,
-            current_delay=random.uniform(inactivity_base - 2, inactivity_base + 2)
-        )
+        self.inactivity = InactivityParams(base_delay=inactivity_base)
+        self.randomize_inactivity_delay()
 
         # Options d'affichage
         self.display = DisplayOptions(
@@ -88,22 +99,29 @@ class AppState:
             show_rate=self.config.get("show_rate", True),
             text_color=self.config.get("text_color", "Vert clair")
         )
+        self.update_display_format()
 
-        # Volume et detection
-        self.volume_history: Deque[float] = collections.deque(maxlen=10)
+        # Volume et detection (historique en anneau avec somme glissante)
+        self.volume_history: List[float] = [0.0] * self.VOLUME_HISTORY_SIZE
+        self.volume_history_index: int = 0
+        self.volume_history_count: int = 0
+        self.volume_history_sum: float = 0.0
         self.baseline_volume: float = 0.0
         self.trigger_count: int = 0
         self.last_trigger_time: float = 0.0
         self.current_volume_level: float = 0.0
 
         # Timing
-        self.last_click_time: float = time.time()
-        self.last_activity_time: float = time.time()
-        self.start_time: float = time.time()
+        now = time.time()
+        self.last_click_time: float = now
+        self.last_activity_time: float = now
+        self.start_time: float = now
 
         # Compteurs
         self.click_counter: int = self.config.get("click_counter", 0)
+        # Horodatages time.monotonic() des clics de la derniere minute
         self.click_timestamps: Deque[float] = collections.deque()
+        self._click_timestamps_lock = threading.Lock()
 
         # Taux lisse
         self.last_rate: float = 0.0
@@ -121,16 +139,49 @@ class AppState:
         """Reinitialise les compteurs d'inactivite."""
         self.last_activity_time = time.time()
         self.inactivity.trigger_count = 0
-        self.inactivity.current_delay = random.uniform(
-            self.inactivity.base_delay - 2,
-            self.inactivity.base_delay + 2
-        )
+        self.randomize_inactivity_delay()
+
+    def randomize_inactivity_delay(self):
+        """Tire un nouveau delai d'inactivite dans [base - 2, base + 2)."""
+        if self._jitter_index >= len(self._jitter_pool):
+            self._jitter_pool = self._jitter_rng.uniform(
+                -2.0, 2.0, self.INACTIVITY_JITTER_POOL_SIZE
+            ).tolist()
+            self._jitter_index = 0
+        jitter = self._jitter_pool[self._jitter_index]
+        self._jitter_index += 1
+        self.inactivity.current_delay = self.inactivity.base_delay + jitter
 
     def update_activity(self):
         """Met a jour le timestamp de derniere activite."""
-        self.last_click_time = time.time()
-        self.last_activity_time = time.time()
-        self.last_trigger_time = time.time()
+        now = time.time()
+        self.last_click_time = now
+        self.last_activity_time = now
+        self.last_trigger_time = now
+
+    def record_click_timestamp(self, now: float):
+        """Enregistre l'horodatage (time.monotonic()) d'un clic et purge les plus anciens."""
+        with self._click_timestamps_lock:
+            self.click_timestamps.append(now)
+            self._prune_click_timestamps(now)
+
+    def get_clicks_per_minute(self, now: float) -> int:
+        """Retourne le nombre de clics sur la derniere minute (now: time.monotonic())."""
+        with self._click_timestamps_lock:
+            self._prune_click_timestamps(now)
+            return len(self.click_timestamps)
+
+    def reset_click_timestamps(self):
+        """Efface les horodatages de clics (calcul du taux remis a zero)."""
+        with self._click_timestamps_lock:
+            self.click_timestamps.clear()
+
+    def _prune_click_timestamps(self, now: float):
+        """Retire les horodatages sortis de la fenetre de calcul du taux."""
+        cutoff = now - self.RATE_WINDOW
+        timestamps = self.click_timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
     def is_action_allowed(self) -> bool:
         """Verifie si les actions automatiques sont autorisees."""
@@ -144,24 +195,28 @@ class AppState:
 
     def get_display_rate(self) -> int:
         """Calcule le taux d'affichage lisse."""
-        current_time = time.time()
-        recent_clicks = [t for t in self.click_timestamps if current_time - t < 60]
-        rate = len(recent_clicks)
-        self.last_rate = self.smoothing_alpha * rate + (1 - self.smoothing_alpha) * self.last_rate
+        rate = self.get_clicks_per_minute(time.monotonic())
+        alpha = self.smoothing_alpha
+        self.last_rate = alpha * rate + (1 - alpha) * self.last_rate
         return int(self.last_rate)
 
+    def update_display_format(self):
+        """Recompile le gabarit de la ligne d'overlay selon les options d'affichage."""
+        display = self.display
+        fields = []
+        if display.show_delay:
+            fields.append("{0:.2f}")
+        if display.show_volume:
+            fields.append("{1:.1f}")
+        if display.show_click_counter:
+            fields.append("{2}")
+        if display.show_rate:
+            fields.append("{3}")
+        self._display_format = " | ".join(fields) if fields else "Ready"
+
     def build_display_line(self, delay: float, volume: float, rate: int) -> str:
         """Construit la ligne d'affichage pour l'overlay."""
-        parts = []
-        if self.display.show_delay:
-            parts.append(f"{delay:.2f}")
-        if self.display.show_volume:
-            parts.append(f"{volume:.1f}")
-        if self.display.show_click_counter:
-            parts.append(str(self.click_counter))
-        if self.display.show_rate:
-            parts.append(str(rate))
-        return " | ".join(parts) if parts else "Ready"
+        return self._display_format.format(delay, volume, self.click_counter, rate)
 
     def to_config_dict(self) -> dict:
         """Convertit l'etat en dictionnaire de configuration."""
@@ -3,44 +3,131 @@ Module de traitement audio.
 Gère la détection et l'analyse du volume des applications.
 """
 
-import numpy as np
+import math
+import time
+import psutil
 from pycaw.pycaw import AudioUtilities, IAudioMeterInformation
-from comtypes import CLSCTX_ALL
+from comtypes import CLSCTX_ALL, COMError
+
+# Cache des compteurs de crête par nom de processus (évite d'énumérer
+# toutes les sessions audio à chaque lecture du volume):
+# nom -> [compteur, PID de la session, dernière vérification du PID]
+_meter_cache: dict = {}
+
+# Intervalle de vérification que le processus de la session existe toujours
+# (un compteur d'une session morte peut renvoyer 0.0 sans COMError)
+METER_PID_CHECK_INTERVAL = 1.0
+
+# Applications exclues de la liste des sources audio
+EXCLUDED_APPS = frozenset({"System", "Registry", "svchost.exe", "RuntimeBroker.exe"})
+
+# Cache de la liste des applications audio (durée de validité en secondes)
+APPS_CACHE_TTL = 2.0
+_apps_cache: list = []
+_apps_cache_time: float = 0.0
 
 
 def get_running_applications() -> list:
     """
     Récupère la liste des applications en cours d'exécution qui produisent du son.
 
+    Le résultat est mis en cache pendant `APPS_CACHE_TTL` secondes.
+
     Returns:
         Liste triée des noms d'applications audio actives.
     """
+    global _apps_cache, _apps_cache_time
+
+    now = time.monotonic()
+    if _apps_cache_time and now - _apps_cache_time < APPS_CACHE_TTL:
+        return list(_apps_cache)
+
     apps = set()
-    excluded_apps = {"System", "Registry", "svchost.exe", "RuntimeBroker.exe"}
+    for session in AudioUtilities.GetAllSessions():
+        if not session.Process:
+            continue
+        try:
+            name = session.Process.name()
+        except Exception:
+            # Processus terminé entre l'énumération et la lecture du nom
+            continue
+        if name not in EXCLUDED_APPS:
+            apps.add(name)
+
+    _apps_cache = sorted(apps)
+    _apps_cache_time = now
+    return list(_apps_cache)
+
+
+def _find_audio_meter(process_name: str):
+    """
+    Recherche le compteur de crête de la session audio d'une application.
+
+    Args:
+        process_name: Nom du processus de l'application.
 
+    Returns:
+        Tuple (IAudioMeterInformation, PID de la session) ou None si
+        l'application n'est pas trouvée.
+    """
     for session in AudioUtilities.GetAllSessions():
-        if session.Process and session.Process.name() not in excluded_apps:
-            apps.add(session.Process.name())
+        if session.Process and session.Process.name() == process_name:
+            return session._ctl.QueryInterface(IAudioMeterInformation), session.ProcessId
+    return None
+
+
+def invalidate_meter_cache(process_name: str = None) -> None:
+    """
+    Invalide le cache des compteurs audio.
 
-    return sorted(list(apps))
+    Args:
+        process_name: Nom du processus à invalider (tous si None).
+    """
+    if process_name is None:
+        _meter_cache.clear()
+    else:
+        _meter_cache.pop(process_name, None)
 
 
 def get_app_volume(process_name: str) -> float:
     """
     Récupère le niveau de volume actuel d'une application.
 
+    Le compteur de la session est résolu une seule fois puis mis en cache;
+    il est évincé et résolu à nouveau si la session disparaît, ou si son
+    processus n'existe plus (application relancée sous le même nom), ce
+    qui est vérifié toutes les METER_PID_CHECK_INTERVAL secondes.
+
     Args:
         process_name: Nom du processus de l'application.
 
     Returns:
         Niveau de volume (0.0 à 1.0) ou None si l'application n'est pas trouvée.
     """
-    sessions = AudioUtilities.GetAllSessions()
-    for session in sessions:
-        if session.Process and session.Process.name() == process_name:
-            audio_meter = session._ctl.QueryInterface(IAudioMeterInformation)
-            return audio_meter.GetPeakValue()
-    return None
+    entry = _meter_cache.get(process_name)
+    if entry is not None:
+        audio_meter, pid, checked_at = entry
+        now = time.monotonic()
+        if now - checked_at >= METER_PID_CHECK_INTERVAL:
+            if psutil.pid_exists(pid):
+                entry[2] = now
+            else:
+                _meter_cache.pop(process_name, None)
+                entry = None
+        if entry is not None:
+            try:
+                return audio_meter.GetPeakValue()
+            except COMError:
+                # Session terminée: évincer et réessayer une fois
+                _meter_cache.pop(process_name, None)
+
+    found = _find_audio_meter(process_name)
+    if found is None:
+        return None
+
+    audio_meter, pid = found
+    _meter_cache[process_name] = [audio_meter, pid, time.monotonic()]
+    return audio_meter.GetPeakValue()
 
 
 def volume_to_db(volume: float) -> float:
@@ -55,7 +142,7 @@ def volume_to_db(volume: float) -> float:
     """
     if volume == 0:
         return -100
-    return 20 * np.log10(volume)
+    return 20 * math.log10(volume)
 
 
 def db_to_normalized_scale(db: float) -> float:
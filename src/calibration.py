@@ -9,6 +9,46 @@ import numpy as np
 from typing import Callable, Optional, List
 
 
+def compute_optimal_threshold(samples: np.ndarray, peaks: np.ndarray) -> float:
+    """
+    Calcule le seuil optimal à partir des échantillons de calibration.
+
+    Args:
+        samples: Niveaux de volume normalisés (0-10) collectés.
+        peaks: Niveaux des pics détectés (poissons qui mordent).
+
+    Returns:
+        Seuil arrondi à 0.1 près et borné entre 4 et 9.
+    """
+    if len(peaks) >= 2:
+        # Si on a détecté des pics, utiliser leur moyenne
+        min_peak = float(peaks.min())
+        avg_peak = float(peaks.mean())
+
+        # Le seuil optimal est légèrement en dessous du plus petit pic
+        threshold = min_peak * 0.85  # 85% du pic minimum
+
+        logging.info(f"Calibration avec {len(peaks)} pics détectés")
+        logging.info(f"Pics: min={min_peak:.1f}, moy={avg_peak:.1f}")
+    else:
+        # Fallback: utiliser la méthode statistique
+        # (moyenne et variance depuis la somme et la somme des carrés)
+        n = len(samples)
+        total = float(samples.sum(dtype=np.float64))
+        total_sq = float(np.einsum('i,i->', samples, samples, dtype=np.float64))
+        mean = total / n
+        std = max(0.0, total_sq / n - mean * mean) ** 0.5
+
+        # Les pics sont au-dessus de mean + 1.5*std
+        threshold = mean + 1.5 * std
+
+        logging.info("Calibration statistique (pas assez de pics)")
+        logging.info(f"Moyenne={mean:.1f}, Écart-type={std:.1f}")
+
+    # Arrondir à 0.1 près puis limiter entre 4 et 9
+    return max(4.0, min(9.0, round(threshold, 1)))
+
+
 class AutoCalibrator:
     """
     Système d'auto-calibration du seuil de détection.
@@ -17,6 +57,9 @@ class AutoCalibrator:
     et calcule le seuil optimal basé sur les pics détectés.
     """
 
+    # Capacité initiale du tampon d'échantillons (échantillons par seconde)
+    SAMPLES_PER_SECOND = 200
+
     def __init__(self, duration: int = 30):
         """
         Initialise le calibrateur.
@@ -24,7 +67,8 @@ class AutoCalibrator:
         Args:
             duration: Durée de la calibration en secondes.
         """
-        self.calibration_data: List[float] = []
+        self._buffer: np.ndarray = np.empty(0, dtype=np.float32)
+        self._count: int = 0
         self.peak_values: List[float] = []
         self.is_calibrating: bool = False
         self.calibration_duration: int = duration
@@ -44,18 +88,27 @@ class AutoCalibrator:
             callback: Fonction appelée à la fin avec le seuil optimal.
             progress_callback: Fonction appelée pour la progression (progress%, temps_restant).
         """
-        self.calibration_data = []
+        self._buffer = np.empty(
+            self.calibration_duration * self.SAMPLES_PER_SECOND,
+            dtype=np.float32
+        )
+        self._count = 0
         self.peak_values = []
         self.is_calibrating = True
         self.callback = callback
         self.progress_callback = progress_callback
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
 
         logging.info(
             f"Calibration démarrée - Pêchez normalement pendant "
             f"{self.calibration_duration} secondes"
         )
 
+    @property
+    def calibration_data(self) -> np.ndarray:
+        """Vue sur les échantillons collectés (sans copie)."""
+        return self._buffer[:self._count]
+
     def add_sample(self, volume_level: float, is_peak: bool = False) -> None:
         """
         Ajoute un échantillon de volume.
@@ -67,7 +120,10 @@ class AutoCalibrator:
         if not self.is_calibrating:
             return
 
-        self.calibration_data.append(volume_level)
+        if self._count >= len(self._buffer):
+            self._buffer = np.resize(self._buffer, max(1, len(self._buffer) * 2))
+        self._buffer[self._count] = volume_level
+        self._count += 1
 
         # Marquer les pics (quand un poisson mord)
         if is_peak:
@@ -75,7 +131,7 @@ class AutoCalibrator:
             logging.info(f"Pic détecté pendant calibration: {volume_level:.1f}")
 
         # Mise à jour du progrès
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         progress = min(100, int((elapsed / self.calibration_duration) * 100))
 
         if self.progress_callback:
@@ -88,44 +144,17 @@ class AutoCalibrator:
 
     def finish_calibration(self) -> None:
         """Termine la calibration et calcule le seuil optimal."""
-        if not self.calibration_data:
+        if self._count == 0:
             self.is_calibrating = False
             if self.callback:
                 self.callback(None)
             return
 
         # Analyser les données
-        data = np.array(self.calibration_data)
-
-        if len(self.peak_values) >= 2:
-            # Si on a détecté des pics, utiliser leur moyenne
-            peaks = np.array(self.peak_values)
-            min_peak = np.min(peaks)
-            avg_peak = np.mean(peaks)
-
-            # Le seuil optimal est légèrement en dessous du plus petit pic
-            threshold = min_peak * 0.85  # 85% du pic minimum
-
-            logging.info(
-                f"Calibration avec {len(self.peak_values)} pics détectés"
-            )
-            logging.info(f"Pics: min={min_peak:.1f}, moy={avg_peak:.1f}")
-        else:
-            # Fallback: utiliser la méthode statistique
-            mean = np.mean(data)
-            std = np.std(data)
-
-            # Les pics sont au-dessus de mean + 1.5*std
-            threshold = mean + 1.5 * std
-
-            logging.info("Calibration statistique (pas assez de pics)")
-            logging.info(f"Moyenne={mean:.1f}, Écart-type={std:.1f}")
-
-        # Arrondir à 0.1 près
-        threshold = round(threshold, 1)
-
-        # Limiter entre 4 et 9
-        threshold = max(4.0, min(9.0, threshold))
+        threshold = compute_optimal_threshold(
+            self.calibration_data,
+            np.asarray(self.peak_values, dtype=np.float64)
+        )
 
         self.is_calibrating = False
         logging.info(f"Calibration terminée - Seuil optimal: {threshold}")
@@ -136,7 +165,7 @@ class AutoCalibrator:
     def cancel(self) -> None:
         """Annule la calibration en cours."""
         self.is_calibrating = False
-        self.calibration_data = []
+        self._count = 0
         self.peak_values = []
         logging.info("Calibration annulée")
 
@@ -150,7 +179,7 @@ class AutoCalibrator:
         if not self.is_calibrating:
             return (0, 0)
 
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         progress = min(100, int((elapsed / self.calibration_duration) * 100))
         remaining = max(0, self.calibration_duration - elapsed)
 
@@ -163,7 +192,7 @@ class AutoCalibrator:
         Returns:
             Nombre d'échantillons.
         """
-        return len(self.calibration_data)
+        return self._count
 
     def get_peak_count(self) -> int:
         """
@@ -3,16 +3,19 @@ AutoFish Minecraft - Gestionnaire de clics.
 """
 
 import time
-import random
+import queue
 import logging
+import threading
 from typing import Optional, Callable, TYPE_CHECKING
 
+import numpy as np
 import win32gui
 import win32con
 import win32api
+import pywintypes
 
-from .window_management import get_process_id_by_name, get_hwnds_for_pid
-from .human_behavior import HumanLikeRandomizer
+from .window_management import get_process_id_by_name, get_hwnds_for_pid, invalidate_hwnd_cache
+from .human_behavior import HumanLikeRandomizer, FLAG_URGENT, FLAG_BOOST
 
 if TYPE_CHECKING:
     from .app_state import AppState
@@ -27,8 +30,20 @@ class ClickHandler:
     - L'execution des clics droits
     - La variation de position des clics
     - Les delais humanises
+
+    Les clics sont executes par un unique thread de travail qui consomme
+    une file d'intentions ('double' ou 'single').
     """
 
+    # Nombre maximal d'intentions de clic en attente
+    MAX_PENDING_CLICKS = 1
+
+    # Duree de validite du handle de fenetre cible (secondes)
+    HWND_TTL = 5.0
+
+    # Taille du lot de tirages uniformes pour les pauses entre messages
+    JITTER_POOL_SIZE = 1024
+
     def __init__(
         self,
         state: 'AppState',
@@ -50,34 +65,120 @@ class ClickHandler:
         self.stats_manager = stats_manager
         self.on_click_callback = on_click_callback
 
+        # Handle de fenetre cible en cache: (pid, hwnd, horodatage monotonic)
+        self._hwnd_entry: Optional[tuple] = None
+
+        # Tirages uniformes [0, 1) pre-generes, utilises par le thread de clics
+        self._rng = np.random.default_rng()
+        self._jitter_pool: list = []
+        self._jitter_index = 0
+
+        self._click_queue = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._click_worker, daemon=True)
+        self._worker.start()
+
+    def _click_worker(self):
+        """Execute les intentions de clic dans l'ordre de reception."""
+        while True:
+            intent = self._click_queue.get()
+            if intent is None:
+                break
+            if intent == 'double':
+                self.perform_double_right_click()
+            elif intent == 'single':
+                self.perform_single_right_click()
+
+    def _enqueue(self, intent: str):
+        """Ajoute une intention de clic si la file n'est pas saturee."""
+        if self._click_queue.qsize() >= self.MAX_PENDING_CLICKS:
+            logging.info(f"Clic '{intent}' ignore: un clic est deja en attente")
+            return
+        self._click_queue.put(intent)
+
+    def request_double_click(self):
+        """Demande un double clic droit (poisson detecte)."""
+        self._enqueue('double')
+
+    def request_single_click(self):
+        """Demande un clic droit simple (inactivite ou test)."""
+        self._enqueue('single')
+
+    def stop(self, timeout: float = 0.25):
+        """
+        Arrete le thread de travail apres les clics en attente.
+
+        Attend au plus `timeout` secondes: un clic en cours (delais humanises)
+        peut depasser ce temps, le thread etant alors abandonne (daemon).
+        """
+        self._click_queue.put(None)
+        self._worker.join(timeout)
+
+    def _uniform(self, low: float, high: float) -> float:
+        """Tirage uniforme dans [low, high) depuis le lot pre-genere."""
+        if self._jitter_index >= len(self._jitter_pool):
+            self._jitter_pool = self._rng.random(self.JITTER_POOL_SIZE).tolist()
+            self._jitter_index = 0
+        u = self._jitter_pool[self._jitter_index]
+        self._jitter_index += 1
+        return low + (high - low) * u
+
     def _get_window_handle(self) -> Optional[int]:
-        """Recupere le handle de la fenetre cible."""
+        """
+        Recupere le handle de la fenetre cible.
+
+        Le handle est reutilise pendant HWND_TTL secondes tant que le PID
+        cible ne change pas; il est oublie si un envoi de message echoue.
+        """
         if not self.state.app_pid:
             self.state.app_pid = get_process_id_by_name(self.state.selected_app)
 
-        if not self.state.app_pid:
+        pid = self.state.app_pid
+        if not pid:
             return None
 
-        hwnds = get_hwnds_for_pid(self.state.app_pid)
-        return hwnds[0] if hwnds else None
+        now = time.monotonic()
+        entry = self._hwnd_entry
+        if entry is not None and entry[0] == pid and now - entry[2] < self.HWND_TTL:
+            return entry[1]
 
-    def _get_click_position(self, hwnd: int, base_x: Optional[int] = None, base_y: Optional[int] = None) -> tuple:
-        """Calcule une position de clic avec variation."""
-        rect = win32gui.GetClientRect(hwnd)
+        hwnds = get_hwnds_for_pid(pid)
+        if not hwnds:
+            self._hwnd_entry = None
+            return None
+
+        self._hwnd_entry = (pid, hwnds[0], now)
+        return hwnds[0]
+
+    def _invalidate_window_handle(self):
+        """
+        Oublie le handle cible (fenetre fermee ou processus relance).
+
+        Le PID est resolu de nouveau immediatement plutot qu'efface: le
+        moniteur de volume cesse d'echantillonner tant qu'il est inconnu.
+        """
+        self._hwnd_entry = None
+        invalidate_hwnd_cache()
+        if self.state.selected_app:
+            self.state.app_pid = get_process_id_by_name(self.state.selected_app)
 
-        if base_x is None:
-            base_x = (rect[2] - rect[0]) // 2
-        if base_y is None:
-            base_y = (rect[3] - rect[1]) // 2
+    def _get_click_positions(self, hwnd: int, count: int = 1) -> list:
+        """Calcule `count` positions de clic successives avec variation."""
+        rect = win32gui.GetClientRect(hwnd)
+        base_x = (rect[2] - rect[0]) // 2
+        base_y = (rect[3] - rect[1]) // 2
 
-        return self.randomizer.get_click_position_variation(base_x, base_y, rect)
+        return self.randomizer.get_click_position_variations(base_x, base_y, rect, count)
 
     def _send_right_click(self, hwnd: int, x: int, y: int):
         """Envoie un clic droit a la fenetre."""
         lParam = win32api.MAKELONG(x, y)
-        win32gui.PostMessage(hwnd, win32con.WM_RBUTTONDOWN, win32con.MK_RBUTTON, lParam)
-        time.sleep(random.uniform(0.01, 0.03))
-        win32gui.PostMessage(hwnd, win32con.WM_RBUTTONUP, 0, lParam)
+        try:
+            win32gui.PostMessage(hwnd, win32con.WM_RBUTTONDOWN, win32con.MK_RBUTTON, lParam)
+            time.sleep(self._uniform(0.01, 0.03))
+            win32gui.PostMessage(hwnd, win32con.WM_RBUTTONUP, 0, lParam)
+        except pywintypes.error:
+            self._invalidate_window_handle()
+            raise
 
     def perform_double_right_click(self, increment_counter: bool = True):
         """
@@ -93,22 +194,25 @@ class ClickHandler:
             if not hwnd:
                 return
 
-            rect = win32gui.GetClientRect(hwnd)
-            x, y = self._get_click_position(hwnd)
+            # Positions des deux clics calculees d'avance
+            (x, y), (x2, y2) = self._get_click_positions(hwnd, 2)
 
             # Premier delai humanise
-            context = {'urgent': self.state.current_volume_level > self.state.detection.threshold * 1.2}
+            detection = self.state.detection
+            volume = self.state.current_volume_level
+            flags = FLAG_BOOST if self.state.is_boost_mode else 0
+            if volume > detection.threshold * 1.2:
+                flags |= FLAG_URGENT
             delay1 = self.randomizer.get_humanized_delay(
-                self.state.detection.min_delay,
-                self.state.detection.max_delay,
-                context,
-                self.state.is_boost_mode
+                detection.min_delay,
+                detection.max_delay,
+                flags
             )
 
             self.state.current_pattern = self.randomizer.last_pattern_type or "steady"
 
             logging.info(
-                f"Clic apres {delay1:.2f}s a ({x},{y}), volume: {self.state.current_volume_level:.1f}"
+                f"Clic apres {delay1:.2f}s a ({x},{y}), volume: {volume:.1f}"
             )
             time.sleep(delay1)
 
@@ -116,14 +220,13 @@ class ClickHandler:
             self._send_right_click(hwnd, x, y)
 
             # Deuxieme clic apres delai
-            delay2 = random.uniform(0.5, 0.7)
+            delay2 = self._uniform(0.5, 0.7)
             time.sleep(delay2)
 
-            x2, y2 = self._get_click_position(hwnd, x, y)
             self._send_right_click(hwnd, x2, y2)
 
             # Attendre le delai post-action
-            time.sleep(self.state.detection.post_action_delay)
+            time.sleep(detection.post_action_delay)
 
             # Mettre a jour les timestamps
             self.state.update_activity()
@@ -148,20 +251,20 @@ class ClickHandler:
             if not hwnd:
                 return
 
-            x, y = self._get_click_position(hwnd)
+            x, y = self._get_click_positions(hwnd)[0]
 
             delay = self.randomizer.get_humanized_delay(
                 self.state.detection.min_delay,
                 self.state.detection.max_delay,
-                {},
-                self.state.is_boost_mode
+                FLAG_BOOST if self.state.is_boost_mode else 0
             )
             time.sleep(delay)
 
             self._send_right_click(hwnd, x, y)
 
-            self.state.last_click_time = time.time()
-            self.state.last_activity_time = time.time()
+            now = time.time()
+            self.state.last_click_time = now
+            self.state.last_activity_time = now
 
             if increment_counter:
                 self._record_click(delay, "inactivity")
@@ -174,7 +277,7 @@ class ClickHandler:
     def _record_click(self, delay: float, pattern: str):
         """Enregistre un clic dans les statistiques."""
         self.state.click_counter += 1
-        self.state.click_timestamps.append(time.time())
+        self.state.record_click_timestamp(time.monotonic())
         self.stats_manager.record_click(delay, pattern, True)
 
         if self.on_click_callback:
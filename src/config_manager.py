@@ -4,8 +4,10 @@ Gère le chargement et la sauvegarde des paramètres de l'application.
 """
 
 import os
+import copy
 import json
 import logging
+import threading
 
 # Répertoire du script
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -32,6 +34,14 @@ DEFAULT_CONFIG = {
     "human_profile": None
 }
 
+# Dernière configuration écrite dans CONFIG_FILE (évite l'encodage et
+# la réécriture d'un contenu identique)
+_last_saved = None
+
+# Sérialise les écritures: celle de la fermeture (thread Tk) peut croiser
+# une sauvegarde encore en cours sur le thread d'entrées/sorties
+_save_lock = threading.Lock()
+
 
 def load_config() -> dict:
     """
@@ -42,11 +52,10 @@ def load_config() -> dict:
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 config = json.load(f)
-                # Fusionner avec les valeurs par défaut pour les clés manquantes
-                for key, value in DEFAULT_CONFIG.items():
-                    if key not in config:
-                        config[key] = value
-                return config
+            # Fusionner avec les valeurs par défaut pour les clés manquantes
+            merged = DEFAULT_CONFIG.copy()
+            merged.update(config)
+            return merged
         except (json.JSONDecodeError, IOError) as e:
             logging.error(f"Erreur lors du chargement de la config: {e}")
             return DEFAULT_CONFIG.copy()
@@ -56,16 +65,32 @@ def load_config() -> dict:
 def save_config(config: dict) -> bool:
     """
     Sauvegarde la configuration dans le fichier JSON.
+    L'encodage et l'écriture sont ignorés si la configuration est égale à
+    la dernière sauvegardée; l'écriture passe par un fichier temporaire
+    remplacé atomiquement.
     Retourne True en cas de succès, False sinon.
     """
-    try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4, ensure_ascii=False)
-        logging.info("Configuration enregistrée")
-        return True
-    except IOError as e:
-        logging.error(f"Erreur lors de la sauvegarde de la config: {e}")
-        return False
+    global _last_saved
+
+    with _save_lock:
+        if config == _last_saved:
+            return True
+
+        data = json.dumps(config, indent=4, ensure_ascii=False)
+
+        tmp_file = CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_file, CONFIG_FILE)
+            # Copie profonde: une modification en place d'un dictionnaire
+            # imbriqué doit rester visible à la comparaison suivante
+            _last_saved = copy.deepcopy(config)
+            logging.info("Configuration enregistrée")
+            return True
+        except IOError as e:
+            logging.error(f"Erreur lors de la sauvegarde de la config: {e}")
+            return False
 
 
 def get_stats_file_path() -> str:
@@ -4,19 +4,39 @@ Gère la randomisation réaliste des délais et positions de clic.
 """
 
 import time
-import random
 import logging
-import collections
+from math import sin, pi
 import numpy as np
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Tuple
+from typing import Optional, List, Tuple
+
+# Générateur PCG64 partagé pour la génération de profils
+_profile_rng = np.random.default_rng()
+
+_TWO_PI = 2.0 * pi
+
+# Inverses des périodes des ondes de concentration (secondes)
+_INV_120 = 1.0 / 120
+_INV_45 = 1.0 / 45
+
+# Table des micro-variations sinusoïdales, échantillonnée à 1 ms sur 100 s
+MICRO_TABLE_RESOLUTION = 1000
+_micro_t = np.arange(100 * MICRO_TABLE_RESOLUTION) / MICRO_TABLE_RESOLUTION
+_MICRO_TBL = (
+    np.sin(_micro_t * 2.3) * 0.02 +
+    np.sin(_micro_t * 5.7) * 0.01 +
+    np.sin(_micro_t * 11.3) * 0.005
+).astype(np.float32)
+del _micro_t
 
 
-@dataclass
 class HumanProfile:
     """
     Profil comportemental simulant un humain spécifique.
 
+    Classe à `__slots__` (pas de `__dict__` par instance) et immuable,
+    comme un dataclass `frozen`: HumanLikeRandomizer peut ainsi mettre en
+    cache les valeurs dérivées du profil.
+
     Attributes:
         name: Nom du profil.
         reaction_speed: Vitesse de réaction (0.5=lent, 1.0=normal, 1.5=rapide).
@@ -25,12 +45,58 @@ class HumanProfile:
         concentration_level: Niveau de concentration (0.0=distrait, 1.0=concentré).
         rhythm_variation: Variation du rythme (0.0=robotique, 1.0=très varié).
     """
-    name: str = "Default"
-    reaction_speed: float = 1.0
-    consistency: float = 0.5
-    fatigue_rate: float = 0.5
-    concentration_level: float = 0.6
-    rhythm_variation: float = 0.5
+
+    __slots__ = (
+        'name',
+        'reaction_speed',
+        'consistency',
+        'fatigue_rate',
+        'concentration_level',
+        'rhythm_variation',
+    )
+
+    def __init__(
+        self,
+        name: str = "Default",
+        reaction_speed: float = 1.0,
+        consistency: float = 0.5,
+        fatigue_rate: float = 0.5,
+        concentration_level: float = 0.6,
+        rhythm_variation: float = 0.5
+    ):
+        setattr_ = object.__setattr__
+        setattr_(self, 'name', name)
+        setattr_(self, 'reaction_speed', reaction_speed)
+        setattr_(self, 'consistency', consistency)
+        setattr_(self, 'fatigue_rate', fatigue_rate)
+        setattr_(self, 'concentration_level', concentration_level)
+        setattr_(self, 'rhythm_variation', rhythm_variation)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field)
+            for field in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, field) for field in self.__slots__))
+
+    def __reduce__(self):
+        # copy et pickle reconstruisent le profil via __init__, le
+        # __setattr__ bloquant empêchant la restauration d'état par défaut
+        return (self.__class__, tuple(getattr(self, field) for field in self.__slots__))
 
     @classmethod
     def generate_random(cls, name: str = "Random") -> "HumanProfile":
@@ -43,29 +109,29 @@ class HumanProfile:
         Returns:
             Un nouveau HumanProfile avec des valeurs aléatoires cohérentes.
         """
-        reaction_speed = random.gauss(1.0, 0.2)
-        consistency = random.betavariate(2, 2)
+        reaction_speed = float(_profile_rng.normal(1.0, 0.2))
+        # Tirages Beta(2,2), Beta(2,3) et Beta(3,2) en un seul appel
+        consistency, fatigue_rate, concentration_level = \
+            _profile_rng.beta((2, 2, 3), (2, 3, 2)).tolist()
 
         # Les personnes rapides sont souvent moins consistantes
         if reaction_speed > 1.2:
             consistency *= 0.8
 
-        fatigue_rate = random.betavariate(2, 3)
-        concentration_level = random.betavariate(3, 2)
-        rhythm_variation = 1.0 - (concentration_level * 0.5)
-
+        # Les tirages Beta sont déjà dans [0, 1] et rhythm_variation dans
+        # [0.5, 1]: seules la vitesse et la consistance minimale sont bornées
         return cls(
             name=name,
             reaction_speed=max(0.3, min(2.0, reaction_speed)),
-            consistency=max(0.1, min(1.0, consistency)),
-            fatigue_rate=max(0.0, min(1.0, fatigue_rate)),
-            concentration_level=max(0.0, min(1.0, concentration_level)),
-            rhythm_variation=max(0.1, min(1.0, rhythm_variation))
+            consistency=max(0.1, consistency),
+            fatigue_rate=fatigue_rate,
+            concentration_level=concentration_level,
+            rhythm_variation=1.0 - (concentration_level * 0.5)
         )
 
     def to_dict(self) -> dict:
         """Convertit le profil en dictionnaire."""
-        return asdict(self)
+        return {field: getattr(self, field) for field in self.__slots__}
 
     @classmethod
     def from_dict(cls, data: dict) -> "HumanProfile":
@@ -73,6 +139,98 @@ class HumanProfile:
         return cls(**data)
 
 
+# Identifiants entiers des patterns (ordre de HumanLikeRandomizer.BEHAVIOR_PATTERNS)
+PATTERN_STEADY = 0
+PATTERN_ACCELERATING = 1
+PATTERN_DECELERATING = 2
+PATTERN_ERRATIC = 3
+PATTERN_RHYTHMIC = 4
+PATTERN_TIRED = 5
+
+# Drapeaux de contexte pour le calcul des délais (champ de bits)
+FLAG_URGENT = 1
+FLAG_LONG_REPETITION = 2
+FLAG_BOOST = 4
+
+
+def _compute_delay_kernel(
+    pattern_id: int,
+    min_delay: float,
+    max_delay: float,
+    streak: int,
+    action_count: int,
+    variation: float,
+    reaction_speed: float,
+    fatigue: float,
+    concentration: float,
+    micro: float,
+    flags: int,
+    gauss: float,
+    uniforms: Tuple[float, ...]
+) -> float:
+    """
+    Noyau numérique de calcul du délai humanisé.
+
+    Fonction pure: tous les tirages aléatoires sont fournis par l'appelant
+    (`gauss` ~ N(0, 1) et sept tirages uniformes dans [0, 1)).
+
+    Returns:
+        Délai humanisé en secondes.
+    """
+    base_mean = (min_delay + max_delay) / 2
+    spread = max_delay - min_delay
+    sigma = base_mean * variation
+
+    # Calculer le délai selon le pattern
+    if pattern_id == PATTERN_STEADY:
+        delay = base_mean + sigma * gauss
+    elif pattern_id == PATTERN_ACCELERATING:
+        progress = min(1.0, streak / 10)
+        delay = max_delay - spread * progress * 0.7 + sigma * gauss
+    elif pattern_id == PATTERN_DECELERATING:
+        progress = min(1.0, streak / 10)
+        delay = min_delay + spread * progress * 0.7 + sigma * gauss
+    elif pattern_id == PATTERN_ERRATIC:
+        delay = min_delay + spread * uniforms[0]
+        if uniforms[1] < 0.2:
+            delay *= 0.5 if uniforms[2] < 0.5 else 1.8
+    elif pattern_id == PATTERN_RHYTHMIC:
+        rhythm_base = base_mean + sin(action_count * 0.5) * spread * 0.3
+        delay = rhythm_base + sigma * gauss
+    else:  # tired
+        delay = max_delay * 0.9 + sigma * gauss
+
+    # Mode boost: délais plus courts
+    if flags & FLAG_BOOST:
+        if uniforms[3] < 0.9:
+            delay = min_delay + 0.2 * spread * uniforms[4]
+        else:
+            delay = min_delay + spread * uniforms[4]
+
+    # Appliquer les modificateurs
+    delay *= reaction_speed
+    delay *= fatigue
+    delay *= concentration
+    delay += micro
+
+    # Contexte
+    if flags & FLAG_URGENT:
+        delay *= 0.7
+    if flags & FLAG_LONG_REPETITION:
+        delay *= 1.1
+
+    # Contraindre aux limites avec légère flexibilité (5% de débordement)
+    if delay < min_delay or delay > max_delay:
+        if uniforms[5] >= 0.95:
+            delay = min(max(delay, min_delay * 0.9), max_delay * 1.1)
+        elif delay < min_delay:
+            delay = min_delay + 0.05 * uniforms[6]
+        else:
+            delay = max_delay - 0.05 * uniforms[6]
+
+    return delay
+
+
 class HumanLikeRandomizer:
     """
     Système avancé de randomisation simulant le comportement humain.
@@ -90,6 +248,51 @@ class HumanLikeRandomizer:
         'tired': {'weight': 0.05, 'variation': 0.3}
     }
 
+    # Tables parallèles indexées par identifiant de pattern (PATTERN_*)
+    _PATTERN_KEYS = tuple(BEHAVIOR_PATTERNS)
+    _BASE_WEIGHTS = tuple(info['weight'] for info in BEHAVIOR_PATTERNS.values())
+    _PATTERN_VARIATIONS = tuple(info['variation'] for info in BEHAVIOR_PATTERNS.values())
+    _PATTERN_INDEX = {pattern: i for i, pattern in enumerate(BEHAVIOR_PATTERNS)}
+    _IDX_STEADY = _PATTERN_INDEX['steady']
+    _IDX_ERRATIC = _PATTERN_INDEX['erratic']
+    _IDX_TIRED = _PATTERN_INDEX['tired']
+
+    # Taille des réserves de tirages aléatoires précalculés
+    RANDOM_POOL_SIZE = 4096
+
+    # Durée de validité de la concentration (secondes), très inférieure à la
+    # période de la micro-onde (8 s); elle ne dépend que de l'horloge
+    CONCENTRATION_TTL = 0.1
+
+    __slots__ = (
+        'profile',
+        '_rng',
+        '_normal_pool',
+        '_normal_index',
+        '_uniform_pool',
+        '_uniform_index',
+        'session_start',
+        'action_count',
+        '_micro_offset',
+        'concentration_phase',
+        'fatigue_accumulator',
+        'last_action_time',
+        'streak_counter',
+        'last_pattern_type',
+        '_last_pattern_id',
+        '_weights_buffer',
+        '_inv_conc',
+        '_fatigue_per_sec',
+        '_fatigue_accum_step',
+        '_reaction_speed',
+        '_rhythm_variation',
+        '_weights_normal',
+        '_weights_tired',
+        '_tremor_scale',
+        '_concentration',
+        '_concentration_at',
+    )
+
     def __init__(self, profile: Optional[HumanProfile] = None):
         """
         Initialise le randomizer avec un profil humain.
@@ -98,134 +301,210 @@ class HumanLikeRandomizer:
             profile: Profil humain à utiliser (génère un aléatoire si None).
         """
         self.profile = profile or HumanProfile.generate_random()
-        self.session_start = time.time()
+
+        # Constantes dérivées du profil, lues à chaque délai
+        profile = self.profile
+        self._inv_conc = 1.0 - profile.concentration_level
+        self._fatigue_per_sec = profile.fatigue_rate / 3600.0
+        self._fatigue_accum_step = 0.001 * profile.fatigue_rate
+        self._reaction_speed = profile.reaction_speed
+        self._rhythm_variation = profile.rhythm_variation
+        self._tremor_scale = 1.0 - profile.consistency
+
+        # Réserves de tirages générées par lots (PCG64)
+        self._rng = np.random.default_rng()
+        self._normal_pool = self._rng.standard_normal(self.RANDOM_POOL_SIZE).tolist()
+        self._normal_index = 0
+        self._uniform_pool = self._rng.random(self.RANDOM_POOL_SIZE).tolist()
+        self._uniform_index = 0
+
+        self.session_start = time.perf_counter()
         self.action_count = 0
-        self.last_delays = collections.deque(maxlen=20)
-        self.micro_rhythm_phase = random.random() * 2 * np.pi
-        self.concentration_phase = random.random() * 2 * np.pi
+        # Déphasage propre à cette instance dans la table des micro-variations
+        self._micro_offset = int(self._random() * len(_MICRO_TBL))
+        self.concentration_phase = self._random() * _TWO_PI
         self.fatigue_accumulator = 0.0
-        self.last_action_time = time.time()
+        self.last_action_time = time.perf_counter()
         self.streak_counter = 0
         self.last_pattern_type = None
+        self._last_pattern_id = -1
+        self._weights_buffer = list(self._BASE_WEIGHTS)
+
+        # Poids ajustés selon le profil, hors fatigue et en état de fatigue
+        weights = list(self._BASE_WEIGHTS)
+        if profile.consistency > 0.7:
+            weights[self._IDX_STEADY] *= 1.5
+        elif profile.consistency < 0.3:
+            weights[self._IDX_ERRATIC] *= 1.5
+        self._weights_normal = tuple(weights)
+        weights[self._IDX_TIRED] *= 2.0
+        self._weights_tired = tuple(weights)
+
+        # Concentration en cache et horodatage de son calcul
+        self._concentration = 1.0
+        self._concentration_at = float('-inf')
 
         logging.info(
-            f"Profil '{self.profile.name}': "
-            f"V={self.profile.reaction_speed:.2f}, "
-            f"C={self.profile.consistency:.2f}"
+            "Profil '%s': V=%.2f, C=%.2f",
+            profile.name, profile.reaction_speed, profile.consistency
         )
 
-    def get_fatigue_factor(self) -> float:
+    def _next_normal(self) -> float:
+        """Retourne le prochain tirage de loi normale centrée réduite."""
+        if self._normal_index >= self.RANDOM_POOL_SIZE:
+            self._normal_pool = self._rng.standard_normal(self.RANDOM_POOL_SIZE).tolist()
+            self._normal_index = 0
+        value = self._normal_pool[self._normal_index]
+        self._normal_index += 1
+        return value
+
+    def _random(self) -> float:
+        """Retourne le prochain tirage uniforme dans [0, 1)."""
+        if self._uniform_index >= self.RANDOM_POOL_SIZE:
+            self._uniform_pool = self._rng.random(self.RANDOM_POOL_SIZE).tolist()
+            self._uniform_index = 0
+        value = self._uniform_pool[self._uniform_index]
+        self._uniform_index += 1
+        return value
+
+    def _gauss(self, mu: float, sigma: float) -> float:
+        """Tirage gaussien équivalent à `random.gauss`."""
+        return mu + sigma * self._next_normal()
+
+    def get_fatigue_factor(self, now: Optional[float] = None) -> float:
         """
         Calcule le facteur de fatigue actuel.
 
         La fatigue augmente avec le temps de session et diminue
         lors des périodes d'inactivité.
 
+        Args:
+            now: Horodatage `time.perf_counter()` courant (lu si None).
+
         Returns:
             Facteur de fatigue (1.0 = normal, >1.0 = fatigué).
         """
-        session_duration = time.time() - self.session_start
-        base_fatigue = min(1.0, (session_duration / 3600) * self.profile.fatigue_rate)
+        if now is None:
+            now = time.perf_counter()
+
+        session_duration = now - self.session_start
+        base_fatigue = min(1.0, session_duration * self._fatigue_per_sec)
 
         # Récupération lors de l'inactivité
-        time_since_last = time.time() - self.last_action_time
+        time_since_last = now - self.last_action_time
         if time_since_last > 10:
             recovery = min(0.3, time_since_last / 60)
             base_fatigue = max(0, base_fatigue - recovery)
 
         # Accumulation progressive de fatigue
-        self.fatigue_accumulator += 0.001 * self.profile.fatigue_rate
+        self.fatigue_accumulator += self._fatigue_accum_step
         self.fatigue_accumulator = min(0.5, self.fatigue_accumulator)
 
         return 1.0 + (base_fatigue + self.fatigue_accumulator) * 0.5
 
-    def get_concentration_wave(self) -> float:
+    def get_concentration_wave(self, now: Optional[float] = None) -> float:
         """
         Simule les fluctuations de concentration.
 
         Utilise des ondes sinusoïdales pour simuler les variations
-        naturelles de l'attention humaine.
+        naturelles de l'attention humaine. La valeur est réutilisée
+        pendant CONCENTRATION_TTL secondes, d'un appel ou d'une action à
+        l'autre (position puis délai d'un même clic, par exemple).
+
+        Args:
+            now: Horodatage `time.perf_counter()` courant (lu si None).
 
         Returns:
             Niveau de concentration (0.3 à 1.0).
         """
-        current_time = time.time()
-
-        # Onde principale (cycle de 2 minutes)
-        primary_wave = np.sin(current_time / 120 + self.concentration_phase)
-        # Onde secondaire (cycle de 45 secondes)
-        secondary_wave = np.sin(current_time / 45) * 0.3
-        # Micro-onde (cycle de 8 secondes)
-        micro_wave = np.sin(current_time / 8) * 0.1
+        current_time = time.perf_counter() if now is None else now
+        if current_time - self._concentration_at < self.CONCENTRATION_TTL:
+            return self._concentration
+
+        # Onde principale (cycle de 2 minutes), secondaire (45 secondes)
+        # et micro-onde (8 secondes) sommées en une seule expression
+        wave = (
+            sin(current_time * _INV_120 + self.concentration_phase) * 0.2 +
+            sin(current_time * _INV_45) * 0.3 +
+            sin(current_time * 0.125) * 0.1
+        )
 
-        concentration = self.profile.concentration_level + \
-            (primary_wave * 0.2 + secondary_wave + micro_wave) * \
-            (1.0 - self.profile.concentration_level)
+        inv_conc = self._inv_conc
+        concentration = max(0.3, min(1.0, 1.0 - inv_conc + wave * inv_conc))
 
-        return max(0.3, min(1.0, concentration))
+        self._concentration = concentration
+        self._concentration_at = current_time
+        return concentration
 
-    def get_micro_variations(self) -> float:
+    def get_micro_variations(self, now: Optional[float] = None) -> float:
         """
         Génère des micro-variations réalistes.
 
         Combine plusieurs fréquences pour créer une variation
         naturelle et non-périodique.
 
+        Args:
+            now: Horodatage `time.perf_counter()` courant (lu si None).
+
         Returns:
             Micro-variation à ajouter au délai.
         """
-        current_time = time.time()
+        current_time = time.perf_counter() if now is None else now
 
-        v1 = np.sin(current_time * 2.3 + self.micro_rhythm_phase) * 0.02
-        v2 = np.sin(current_time * 5.7) * 0.01
-        v3 = np.sin(current_time * 11.3) * 0.005
-        v4 = random.gauss(0, 0.01)
+        index = int(current_time * MICRO_TABLE_RESOLUTION) + self._micro_offset
+        wave = float(_MICRO_TBL[index % len(_MICRO_TBL)])
+        noise = self._gauss(0, 0.01)
 
-        return (v1 + v2 + v3 + v4) * self.profile.rhythm_variation
+        return (wave + noise) * self._rhythm_variation
 
-    def select_behavior_pattern(self) -> str:
+    def select_behavior_pattern(self, now: Optional[float] = None) -> str:
         """
         Sélectionne un pattern comportemental de manière cohérente.
 
         Prend en compte le pattern précédent, le profil de l'utilisateur
         et le niveau de fatigue actuel.
 
+        Args:
+            now: Horodatage `time.perf_counter()` courant (lu si None).
+
         Returns:
             Nom du pattern sélectionné.
         """
-        weights = []
-        for pattern, info in self.BEHAVIOR_PATTERNS.items():
-            weight = info['weight']
-
-            # Éviter de répéter le même pattern
-            if pattern == self.last_pattern_type:
-                weight *= 0.3
-
-            # Ajuster selon le profil
-            if pattern == 'steady' and self.profile.consistency > 0.7:
-                weight *= 1.5
-            elif pattern == 'erratic' and self.profile.consistency < 0.3:
-                weight *= 1.5
-            elif pattern == 'tired' and self.get_fatigue_factor() > 1.3:
-                weight *= 2.0
-
-            weights.append(weight)
-
-        patterns = list(self.BEHAVIOR_PATTERNS.keys())
-        selected = random.choices(patterns, weights=weights)[0]
-
-        if selected != self.last_pattern_type:
-            self.streak_counter = random.randint(3, 15)
-            self.last_pattern_type = selected
-
-        return selected
+        # Poids précalculés selon le profil et l'état de fatigue
+        weights = self._weights_buffer
+        if self.get_fatigue_factor(now) > 1.3:
+            weights[:] = self._weights_tired
+        else:
+            weights[:] = self._weights_normal
+
+        # Éviter de répéter le même pattern
+        last_id = self._last_pattern_id
+        if last_id >= 0:
+            weights[last_id] *= 0.3
+
+        # Tirage pondéré par parcours linéaire des poids cumulés
+        r = self._random() * sum(weights)
+        selected_id = len(weights) - 1
+        acc = 0.0
+        for i, weight in enumerate(weights):
+            acc += weight
+            if r < acc:
+                selected_id = i
+                break
+
+        if selected_id != last_id:
+            # Série de 3 à 15 actions
+            self.streak_counter = 3 + int(self._random() * 13)
+            self._last_pattern_id = selected_id
+            self.last_pattern_type = self._PATTERN_KEYS[selected_id]
+
+        return self._PATTERN_KEYS[selected_id]
 
     def get_humanized_delay(
         self,
         min_delay: float,
         max_delay: float,
-        context: Optional[Dict] = None,
-        is_boost: bool = False
+        flags: int = 0
     ) -> float:
         """
         Génère un délai avec comportement humain réaliste.
@@ -233,84 +512,105 @@ class HumanLikeRandomizer:
         Args:
             min_delay: Délai minimum en secondes.
             max_delay: Délai maximum en secondes.
-            context: Contexte additionnel (urgent, repetition, etc.).
-            is_boost: Active le mode boost (délais plus courts).
+            flags: Combinaison de FLAG_URGENT, FLAG_LONG_REPETITION et FLAG_BOOST.
 
         Returns:
             Délai humanisé en secondes.
         """
-        context = context or {}
         self.action_count += 1
+        now = time.perf_counter()
 
         # Sélectionner ou continuer un pattern
         if self.streak_counter <= 0:
-            pattern = self.select_behavior_pattern()
+            self.select_behavior_pattern(now)
         else:
-            pattern = self.last_pattern_type
             self.streak_counter -= 1
+        pattern_id = self._last_pattern_id
 
-        base_mean = (min_delay + max_delay) / 2
-        pattern_info = self.BEHAVIOR_PATTERNS[pattern]
-
-        # Calculer le délai selon le pattern
-        if pattern == 'steady':
-            delay = random.gauss(base_mean, base_mean * pattern_info['variation'])
-        elif pattern == 'accelerating':
-            progress = min(1.0, self.streak_counter / 10)
-            delay = max_delay - (max_delay - min_delay) * progress * 0.7
-            delay += random.gauss(0, base_mean * pattern_info['variation'])
-        elif pattern == 'decelerating':
-            progress = min(1.0, self.streak_counter / 10)
-            delay = min_delay + (max_delay - min_delay) * progress * 0.7
-            delay += random.gauss(0, base_mean * pattern_info['variation'])
-        elif pattern == 'erratic':
-            delay = random.uniform(min_delay, max_delay)
-            if random.random() < 0.2:
-                delay *= random.choice([0.5, 1.8])
-        elif pattern == 'rhythmic':
-            rhythm_base = base_mean + np.sin(self.action_count * 0.5) * \
-                (max_delay - min_delay) * 0.3
-            delay = random.gauss(rhythm_base, base_mean * pattern_info['variation'])
-        else:  # tired
-            delay = random.gauss(max_delay * 0.9, base_mean * pattern_info['variation'])
-
-        # Mode boost: délais plus courts
-        if is_boost:
-            if random.random() < 0.9:
-                sub_range = min_delay + 0.2 * (max_delay - min_delay)
-                delay = random.uniform(min_delay, sub_range)
-            else:
-                delay = random.uniform(min_delay, max_delay)
-
-        # Appliquer les modificateurs
-        delay *= self.profile.reaction_speed
-        delay *= self.get_fatigue_factor()
-        delay *= self.get_concentration_wave()
-        delay += self.get_micro_variations()
-
-        # Contexte
-        if context.get('urgent'):
-            delay *= 0.7
-        if context.get('repetition', 0) > 10:
-            delay *= 1.1
-
-        # Contraindre aux limites avec légère flexibilité
-        if delay < min_delay:
-            if random.random() < 0.95:
-                delay = min_delay + random.uniform(0, 0.05)
-            else:
-                delay = max(min_delay * 0.9, delay)
-        elif delay > max_delay:
-            if random.random() < 0.95:
-                delay = max_delay - random.uniform(0, 0.05)
-            else:
-                delay = min(max_delay * 1.1, delay)
+        # Tirages aléatoires consommés par le noyau de calcul
+        uniforms = (
+            self._random(), self._random(), self._random(), self._random(),
+            self._random(), self._random(), self._random()
+        )
 
-        self.last_delays.append(delay)
-        self.last_action_time = time.time()
+        delay = _compute_delay_kernel(
+            pattern_id,
+            min_delay,
+            max_delay,
+            self.streak_counter,
+            self.action_count,
+            self._PATTERN_VARIATIONS[pattern_id],
+            self._reaction_speed,
+            self.get_fatigue_factor(now),
+            self.get_concentration_wave(now),
+            self.get_micro_variations(now),
+            flags,
+            self._next_normal(),
+            uniforms
+        )
+
+        self.last_action_time = now
 
         return delay
 
+    def get_humanized_delays_batch(
+        self,
+        min_delay: float,
+        max_delay: float,
+        n: int,
+        flags: int = 0
+    ) -> List[float]:
+        """
+        Génère `n` délais successifs avec les mêmes bornes.
+
+        Équivalent à `n` appels de `get_humanized_delay` au même instant:
+        l'horloge est lue une fois et les tirages aléatoires de tout le lot
+        sont générés en deux appels NumPy.
+
+        Args:
+            min_delay: Délai minimum en secondes.
+            max_delay: Délai maximum en secondes.
+            n: Nombre de délais à générer.
+            flags: Combinaison de FLAG_URGENT, FLAG_LONG_REPETITION et FLAG_BOOST.
+
+        Returns:
+            Liste des `n` délais humanisés en secondes.
+        """
+        now = time.perf_counter()
+        normals = self._rng.standard_normal(n).tolist()
+        uniforms = self._rng.random((n, 7)).tolist()
+        reaction_speed = self._reaction_speed
+        variations = self._PATTERN_VARIATIONS
+
+        delays = []
+        for gauss, draws in zip(normals, uniforms):
+            self.action_count += 1
+            if self.streak_counter <= 0:
+                self.select_behavior_pattern(now)
+            else:
+                self.streak_counter -= 1
+            pattern_id = self._last_pattern_id
+
+            delays.append(_compute_delay_kernel(
+                pattern_id,
+                min_delay,
+                max_delay,
+                self.streak_counter,
+                self.action_count,
+                variations[pattern_id],
+                reaction_speed,
+                self.get_fatigue_factor(now),
+                self.get_concentration_wave(now),
+                self.get_micro_variations(now),
+                flags,
+                gauss,
+                draws
+            ))
+
+        self.last_action_time = now
+
+        return delays
+
     def get_click_position_variation(
         self,
         base_x: int,
@@ -328,6 +628,31 @@ class HumanLikeRandomizer:
         Returns:
             Tuple (x, y) de la nouvelle position.
         """
+        return self.get_click_position_variations(base_x, base_y, window_rect, 1)[0]
+
+    def get_click_position_variations(
+        self,
+        base_x: int,
+        base_y: int,
+        window_rect: Tuple[int, int, int, int],
+        count: int = 2
+    ) -> List[Tuple[int, int]]:
+        """
+        Génère une suite de positions de clic avec variation humaine.
+
+        Chaque position varie autour de la précédente (la première autour
+        de la position de base); les gaussiennes de toute la suite sont
+        tirées en un seul appel.
+
+        Args:
+            base_x: Position X de base.
+            base_y: Position Y de base.
+            window_rect: Rectangle de la fenêtre (left, top, right, bottom).
+            count: Nombre de positions à générer.
+
+        Returns:
+            Liste de `count` tuples (x, y).
+        """
         width = window_rect[2] - window_rect[0]
         height = window_rect[3] - window_rect[1]
 
@@ -340,31 +665,43 @@ class HumanLikeRandomizer:
         max_deviation_x = preferred_zone_x * (2.0 - concentration)
         max_deviation_y = preferred_zone_y * (2.0 - concentration)
 
-        # Génération de la déviation (gaussienne)
-        if random.random() < 0.9:
-            dx = random.gauss(0, max_deviation_x / 3)
-            dy = random.gauss(0, max_deviation_y / 3)
-        else:
-            dx = random.gauss(0, max_deviation_x)
-            dy = random.gauss(0, max_deviation_y)
-
-        # Micro-tremblements basés sur la consistance
-        dx += random.gauss(0, 2) * (1.0 - self.profile.consistency)
-        dy += random.gauss(0, 2) * (1.0 - self.profile.consistency)
-
-        new_x = int(base_x + dx)
-        new_y = int(base_y + dy)
-
-        # Contraindre à l'intérieur de la fenêtre
-        margin = 5
-        new_x = max(margin, min(width - margin, new_x))
-        new_y = max(margin, min(height - margin, new_y))
-
-        return new_x, new_y
+        # Amplitude des micro-tremblements basée sur la consistance
+        tremor = 2 * self._tremor_scale
+
+        # Tirage groupé des quatre gaussiennes de chaque position
+        normals = self._rng.standard_normal(4 * count).tolist()
+
+        # Bornes de la fenêtre avec une marge de 5 pixels
+        min_x = min_y = 5
+        max_x = width - 5
+        max_y = height - 5
+        x, y = base_x, base_y
+        positions = []
+        for i in range(0, 4 * count, 4):
+            n1, n2, n3, n4 = normals[i:i + 4]
+
+            # Déviation gaussienne (resserrée 9 fois sur 10) et micro-tremblements
+            spread = 1.0 / 3 if self._random() < 0.9 else 1.0
+            dx = n1 * max_deviation_x * spread + n3 * tremor
+            dy = n2 * max_deviation_y * spread + n4 * tremor
+
+            # Contraindre à l'intérieur de la fenêtre
+            x = int(x + dx)
+            if x > max_x:
+                x = max_x
+            if x < min_x:
+                x = min_x
+            y = int(y + dy)
+            if y > max_y:
+                y = max_y
+            if y < min_y:
+                y = min_y
+            positions.append((x, y))
+
+        return positions
 
     def reset_session(self):
         """Réinitialise les compteurs de session."""
-        self.session_start = time.time()
+        self.session_start = time.perf_counter()
         self.action_count = 0
         self.fatigue_accumulator = 0.0
-        self.last_delays.clear()
@@ -24,6 +24,9 @@ class KeyboardHandler:
     - T, /, :: Ouvrir chat (si fenetre active)
     - Escape: Fermer inventaire/chat
     - Enter: Fermer chat
+
+    Les callbacks sont appeles depuis le thread du listener pynput; ils
+    doivent transmettre le travail au thread Tkinter (voir AutoFishApp).
     """
 
     def __init__(
@@ -82,7 +85,7 @@ class KeyboardHandler:
                 self._handle_game_keys(key)
 
         except Exception:
-            pass
+            logging.exception("Erreur raccourci clavier")
 
     def _handle_game_keys(self, key):
         """Gere les touches liees au jeu."""
@@ -3,13 +3,12 @@ AutoFish Minecraft - Threads de monitoring.
 """
 
 import time
-import random
 import logging
 import threading
 from typing import Callable, TYPE_CHECKING
 
 from .audio_processing import get_app_volume, volume_to_db, db_to_normalized_scale
-from .window_management import is_application_in_foreground
+from .window_management import is_application_in_foreground, raise_current_thread_priority
 
 if TYPE_CHECKING:
     from .app_state import AppState
@@ -21,8 +20,15 @@ class VolumeMonitor:
     Moniteur de volume audio.
 
     Detecte les pics de volume indiquant qu'un poisson a mordu.
+
+    Le monitoring tourne dans son propre thread; `on_volume_update` est
+    appele depuis ce thread et ne doit pas toucher directement a Tkinter.
     """
 
+    # Periode d'echantillonnage (la baseline et le declenchement sont
+    # calibres en nombre d'echantillons a cette cadence)
+    POLL_INTERVAL = 0.05
+
     def __init__(
         self,
         state: 'AppState',
@@ -36,39 +42,53 @@ class VolumeMonitor:
         Args:
             state: Etat de l'application
             calibrator: Calibrateur automatique
-            on_trigger: Callback quand un declenchement est detecte
-            on_volume_update: Callback pour mise a jour du volume
+            on_trigger: Callback non bloquant quand un declenchement est detecte
+            on_volume_update: Callback pour mise a jour du volume (thread-safe)
         """
         self.state = state
         self.calibrator = calibrator
         self.on_trigger = on_trigger
         self.on_volume_update = on_volume_update
         self._thread = None
+        # Interrompt les attentes de la boucle des l'arret demande
+        self._stop_event = threading.Event()
 
     def start(self):
         """Demarre le monitoring dans un thread."""
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
 
+    def stop(self, timeout: float = 0.25):
+        """Arrete le monitoring et attend la fin du thread (au plus `timeout` s)."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
     def _monitor_loop(self):
         """Boucle principale de monitoring du volume."""
-        while self.state.is_running:
+        raise_current_thread_priority()
+
+        wait = self._stop_event.wait
+        while self.state.is_running and not self._stop_event.is_set():
             try:
                 self._update_foreground_status()
 
                 if not self.state.is_action_allowed():
-                    time.sleep(0.05)
+                    wait(self.POLL_INTERVAL)
                     continue
 
                 if not self.state.selected_app or not self.state.app_pid:
-                    time.sleep(0.05)
+                    wait(self.POLL_INTERVAL)
                     continue
 
                 volume = get_app_volume(self.state.selected_app)
                 if volume is None:
-                    time.sleep(0.05)
+                    wait(self.POLL_INTERVAL)
                     continue
 
+                now = time.time()
                 normalized = self._process_volume(volume)
                 self.state.current_volume_level = normalized
                 self.on_volume_update(normalized)
@@ -82,13 +102,13 @@ class VolumeMonitor:
                 self._update_baseline(normalized)
 
                 # Detection de declenchement
-                self._check_trigger(normalized)
+                self._check_trigger(normalized, now)
 
-                time.sleep(0.05)
+                wait(self.POLL_INTERVAL)
 
             except Exception as e:
                 logging.error(f"Erreur monitoring volume: {e}")
-                time.sleep(1)
+                wait(1)
 
     def _update_foreground_status(self):
         """Met a jour le statut de focus de la fenetre."""
@@ -109,33 +129,38 @@ class VolumeMonitor:
             normalized > 5.0
         )
         self.calibrator.add_sample(normalized, is_peak)
-        time.sleep(0.05)
+        self._stop_event.wait(self.POLL_INTERVAL)
 
     def _update_baseline(self, normalized: float):
         """Met a jour l'historique et la baseline du volume."""
-        self.state.volume_history.append(normalized)
-
-        if len(self.state.volume_history) < 2:
-            self.state.baseline_volume = normalized
+        state = self.state
+        history = state.volume_history
+        index = state.volume_history_index
+
+        # Remplacer l'echantillon le plus ancien en tenant la somme a jour
+        state.volume_history_sum += normalized - history[index]
+        history[index] = normalized
+        state.volume_history_index = (index + 1) % len(history)
+        if state.volume_history_count < len(history):
+            state.volume_history_count += 1
+
+        if state.volume_history_count < 2:
+            state.baseline_volume = normalized
         else:
-            self.state.baseline_volume = (
-                sum(self.state.volume_history) / len(self.state.volume_history)
-            )
+            state.baseline_volume = state.volume_history_sum / state.volume_history_count
 
-    def _check_trigger(self, normalized: float):
-        """Verifie si un declenchement doit avoir lieu."""
+    def _check_trigger(self, normalized: float, now: float):
+        """Verifie si un declenchement doit avoir lieu (now: time.time() de l'iteration)."""
         threshold = self.state.detection.threshold
         cooldown = self.state.detection.cooldown_period
 
         if normalized > threshold and normalized > self.state.baseline_volume * 1.2:
-            current_time = time.time()
-
-            if current_time - self.state.last_trigger_time > cooldown:
+            if now - self.state.last_trigger_time > cooldown:
                 self.state.trigger_count += 1
 
                 if self.state.trigger_count >= 2:
-                    self.state.last_trigger_time = current_time
-                    threading.Thread(target=self.on_trigger, daemon=True).start()
+                    self.state.last_trigger_time = now
+                    self.on_trigger()
                     self.state.trigger_count = 0
         else:
             if self.state.trigger_count > 0:
@@ -147,6 +172,8 @@ class InactivityMonitor:
     Moniteur d'inactivite.
 
     Declenche un clic automatique si aucune activite n'est detectee.
+    `check` est appele periodiquement (toutes les secondes) par la boucle
+    de l'interface.
     """
 
     def __init__(
@@ -161,45 +188,35 @@ class InactivityMonitor:
         Args:
             state: Etat de l'application
             calibrator: Calibrateur automatique
-            on_inactivity: Callback lors d'inactivite detectee
+            on_inactivity: Callback non bloquant lors d'inactivite detectee
         """
         self.state = state
         self.calibrator = calibrator
         self.on_inactivity = on_inactivity
-        self._thread = None
-
-    def start(self):
-        """Demarre le monitoring dans un thread."""
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
-
-    def _monitor_loop(self):
-        """Boucle principale de verification d'inactivite."""
-        while self.state.is_running:
-            try:
-                if not self._should_check_inactivity():
-                    time.sleep(1)
-                    continue
 
-                time_since_last = time.time() - self.state.last_activity_time
+    def check(self):
+        """Effectue une verification d'inactivite."""
+        try:
+            if not self._should_check_inactivity():
+                return
 
-                if time_since_last > self.state.inactivity.current_delay:
-                    self.state.inactivity.trigger_count += 1
+            now = time.time()
+            time_since_last = now - self.state.last_activity_time
 
-                    if self.state.inactivity.trigger_count >= 2:
-                        logging.info(
-                            f"Inactivite detectee ({time_since_last:.1f}s) - Clic automatique"
-                        )
-                        threading.Thread(target=self.on_inactivity, daemon=True).start()
-                        self._reset_inactivity_delay()
-                else:
-                    self.state.inactivity.trigger_count = 0
+            if time_since_last > self.state.inactivity.current_delay:
+                self.state.inactivity.trigger_count += 1
 
-                time.sleep(1)
+                if self.state.inactivity.trigger_count >= 2:
+                    logging.info(
+                        f"Inactivite detectee ({time_since_last:.1f}s) - Clic automatique"
+                    )
+                    self.on_inactivity()
+                    self._reset_inactivity_delay()
+            else:
+                self.state.inactivity.trigger_count = 0
 
-            except Exception as e:
-                logging.error(f"Erreur inactivite: {e}")
-                time.sleep(5)
+        except Exception as e:
+            logging.error(f"Erreur inactivite: {e}")
 
     def _should_check_inactivity(self) -> bool:
         """Verifie si l'inactivite doit etre surveillee."""
@@ -210,8 +227,7 @@ class InactivityMonitor:
 
     def _reset_inactivity_delay(self):
         """Reinitialise le delai d'inactivite."""
-        base = self.state.inactivity.base_delay
-        self.state.inactivity.current_delay = random.uniform(base - 2, base + 2)
+        self.state.randomize_inactivity_delay()
         self.state.inactivity.trigger_count = 0
 
 
@@ -219,34 +235,39 @@ class TempPauseMonitor:
     """
     Moniteur de pause temporaire.
 
-    Gere le compte a rebours de la pause temporaire.
+    Programme une fin de pause unique via `after()` au lieu de
+    surveiller le compte a rebours periodiquement.
     """
 
-    def __init__(self, state: 'AppState', on_pause_end: Callable):
+    def __init__(self, state: 'AppState', scheduler, on_pause_end: Callable):
         """
         Initialise le moniteur de pause temporaire.
 
         Args:
             state: Etat de l'application
+            scheduler: Widget Tkinter utilise pour programmer la fin de pause
             on_pause_end: Callback quand la pause se termine
         """
         self.state = state
+        self.scheduler = scheduler
         self.on_pause_end = on_pause_end
-        self._thread = None
-
-    def start(self):
-        """Demarre le monitoring dans un thread."""
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
-
-    def _monitor_loop(self):
-        """Boucle de gestion de la pause temporaire."""
-        while self.state.is_running:
-            if self.state.temp_pause_remaining > 0:
-                elapsed = time.time() - self.state.temp_pause_start
-                self.state.temp_pause_remaining = max(0, 15 - elapsed)
-
-                if self.state.temp_pause_remaining == 0:
-                    self.on_pause_end()
-
-            time.sleep(0.5)
+        self._job = None
+
+    def start(self, seconds: float):
+        """Demarre (ou relance) une pause temporaire."""
+        self.cancel()
+        self.state.temp_pause_remaining = seconds
+        self.state.temp_pause_start = time.time()
+        self._job = self.scheduler.after(int(seconds * 1000), self._finish)
+
+    def cancel(self):
+        """Annule la fin de pause programmee."""
+        if self._job is not None:
+            self.scheduler.after_cancel(self._job)
+            self._job = None
+
+    def _finish(self):
+        """Termine la pause temporaire."""
+        self._job = None
+        self.state.temp_pause_remaining = 0
+        self.on_pause_end()
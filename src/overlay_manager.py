@@ -37,8 +37,14 @@ class OverlayManager:
 
         # Fenetres
         self.indicator_window: Optional[tk.Toplevel] = None
+        self.indicator_canvas: Optional[tk.Canvas] = None
+        self._indicator_rect: Optional[int] = None
         self.delay_label_window: Optional[tk.Toplevel] = None
         self.delay_label: Optional[tk.Label] = None
+        self._indicator_color: Optional[str] = None
+
+        # Couleur tkinter du texte, resolue une fois par changement de couleur
+        self._resolved_fg = translate_color(self.state.display.text_color)
 
     def create(self):
         """Cree les fenetres overlay."""
@@ -52,9 +58,19 @@ class OverlayManager:
         self.indicator_window.attributes("-topmost", True)
         self.indicator_window.attributes("-alpha", 0.8)
         self.indicator_window.geometry("20x20+5+5")
-        self.indicator_window.configure(bg="red")
+
+        # Carre dessine dans un canvas: un changement d'etat ne modifie
+        # que la couleur de remplissage du rectangle
+        self.indicator_canvas = tk.Canvas(
+            self.indicator_window, width=20, height=20, highlightthickness=0
+        )
+        self.indicator_canvas.pack()
+        self._indicator_rect = self.indicator_canvas.create_rectangle(
+            0, 0, 20, 20, fill="red", outline=""
+        )
+        self._indicator_color = "red"
         self.indicator_window.bind("<Button-1>", lambda e: self.on_indicator_click())
-        self._keep_indicator_on_top()
+        self._bind_keep_on_top(self.indicator_window)
 
     def _create_delay_label(self):
         """Cree le label d'affichage avec fond semi-transparent."""
@@ -72,29 +88,29 @@ class OverlayManager:
             textvariable=self.delay_label_var,
             font=('Arial', 11, 'bold'),
             bg='#1a1a1a',  # Fond gris fonce semi-transparent
-            fg=translate_color(self.state.display.text_color),
+            fg=self._resolved_fg,
             padx=6,
             pady=2
         )
         self.delay_label.pack()
-        self._keep_text_on_top()
-
-    def _keep_indicator_on_top(self):
-        """Maintient l'indicateur au premier plan."""
-        if self.indicator_window and self.indicator_window.winfo_exists():
-            self.indicator_window.attributes("-topmost", True)
-            self.indicator_window.lift()
-            self.parent.after(1000, self._keep_indicator_on_top)
-
-    def _keep_text_on_top(self):
-        """Maintient le texte au premier plan."""
-        if self.delay_label_window and self.delay_label_window.winfo_exists():
-            self.delay_label_window.attributes("-topmost", True)
-            self.delay_label_window.lift()
-            self.parent.after(1000, self._keep_text_on_top)
+        self._bind_keep_on_top(self.delay_label_window)
+
+    def _bind_keep_on_top(self, window: tk.Toplevel):
+        """Remet la fenetre au premier plan quand le systeme la masque."""
+        def raise_window(event):
+            if window.winfo_exists():
+                window.attributes("-topmost", True)
+                window.lift()
+
+        window.bind("<Visibility>", raise_window)
+        window.bind("<FocusOut>", raise_window)
 
     def update_indicator_color(self):
-        """Met a jour la couleur de l'indicateur selon l'etat."""
+        """
+        Met a jour la couleur de l'indicateur selon l'etat.
+
+        La fenetre n'est reconfiguree que si la couleur change.
+        """
         if self.state.is_completely_disabled:
             color = "grey"
         elif self.state.temp_pause_remaining > 0:
@@ -106,19 +122,26 @@ class OverlayManager:
         else:
             color = "green"
 
-        if self.indicator_window:
-            self.indicator_window.configure(bg=color)
+        if color == self._indicator_color:
+            return
+
+        if self.indicator_canvas:
+            self.indicator_canvas.itemconfig(self._indicator_rect, fill=color)
+            self._indicator_color = color
 
     def update_delay_text(self, text: str):
         """Met a jour le texte d'affichage."""
         self.delay_label_var.set(text)
-        if self.delay_label:
-            self.delay_label.config(fg=translate_color(self.state.display.text_color))
 
     def update_text_color(self):
-        """Met a jour la couleur du texte."""
+        """Met a jour la couleur du texte apres un changement de couleur."""
+        color = translate_color(self.state.display.text_color)
+        if color == self._resolved_fg:
+            return
+
+        self._resolved_fg = color
         if self.delay_label:
-            self.delay_label.config(fg=translate_color(self.state.display.text_color))
+            self.delay_label.config(fg=color)
 
     def destroy(self):
         """Detruit les fenetres overlay."""
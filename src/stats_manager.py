@@ -5,21 +5,47 @@ Gère le suivi et la persistance des statistiques de pêche.
 
 import os
 import json
+import time
+import atexit
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 from .config_manager import get_stats_file_path
 
 
+def _date_key(date: datetime) -> int:
+    """Retourne la clé entière AAAAMMJJ d'une date."""
+    return date.year * 10000 + date.month * 100 + date.day
+
+
+def _date_key_to_str(key: int) -> str:
+    """Convertit une clé AAAAMMJJ en chaîne 'AAAA-MM-JJ'."""
+    return f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}"
+
+
+def _date_str_to_key(date: str) -> int:
+    """Convertit une chaîne 'AAAA-MM-JJ' en clé AAAAMMJJ."""
+    return int(date.replace('-', ''))
+
+
 class StatsManager:
     """
     Gestionnaire de statistiques avancées.
 
     Suit les clics, les poissons pêchés, les temps de réaction
     et d'autres métriques de performance.
+
+    Les statistiques sont accumulées en mémoire et écrites sur disque
+    périodiquement par un thread de fond, ainsi qu'à la fermeture.
+    En mémoire, `daily_stats` est indexé par des clés entières AAAAMMJJ;
+    le fichier conserve des dates 'AAAA-MM-JJ'.
     """
 
+    # Intervalle entre deux écritures différées (secondes)
+    FLUSH_INTERVAL = 5.0
+
     def __init__(self, stats_file: Optional[str] = None):
         """
         Initialise le gestionnaire de statistiques.
@@ -28,8 +54,18 @@ class StatsManager:
             stats_file: Chemin du fichier de statistiques (optionnel).
         """
         self.stats_file = stats_file or get_stats_file_path()
+        # Entrées quotidiennes dont la date n'a pas pu être lue: conservées
+        # telles quelles et réécrites à chaque sauvegarde
+        self._unparsed_daily_stats: Dict[str, Any] = {}
         self.stats = self._load_stats()
 
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush)
+
     def _default_stats(self) -> Dict[str, Any]:
         """
         Retourne les statistiques par défaut.
@@ -66,12 +102,29 @@ class StatsManager:
                     for key, value in default.items():
                         if key not in stats:
                             stats[key] = value
+                    stats['daily_stats'] = self._daily_stats_from_file(stats['daily_stats'])
                     return stats
             except (json.JSONDecodeError, IOError) as e:
                 logging.error(f"Erreur lors du chargement des stats: {e}")
                 return self._default_stats()
         return self._default_stats()
 
+    def _daily_stats_from_file(self, daily_stats: Dict[str, Any]) -> Dict[int, Any]:
+        """
+        Convertit les dates du fichier en clés entières.
+
+        Les dates illisibles sont journalisées et mises de côté dans
+        `_unparsed_daily_stats` pour ne pas être perdues à la sauvegarde.
+        """
+        converted = {}
+        for date, day_stats in daily_stats.items():
+            try:
+                converted[_date_str_to_key(date)] = day_stats
+            except ValueError:
+                logging.warning(f"Date de statistiques invalide conservée telle quelle: {date}")
+                self._unparsed_daily_stats[date] = day_stats
+        return converted
+
     def save_stats(self) -> bool:
         """
         Sauvegarde les statistiques dans le fichier.
@@ -79,13 +132,65 @@ class StatsManager:
         Returns:
             True si la sauvegarde a réussi, False sinon.
         """
-        try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
+        # Le verrou d'écriture couvre l'instantané et le remplacement du
+        # fichier: deux sauvegardes concurrentes ne peuvent pas s'inverser.
+        # Seule la copie se fait sous `_lock` (pris par les clics);
+        # l'encodage JSON se fait hors de ce verrou
+        with self._write_lock:
+            with self._lock:
+                stats = self._snapshot()
+                self._dirty = False
+
+            data = json.dumps(stats, indent=2, ensure_ascii=False)
+            tmp_file = self.stats_file + ".tmp"
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.stats_file)
+                return True
+            except IOError as e:
+                logging.error(f"Erreur lors de la sauvegarde des stats: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Copie les statistiques au format du fichier (appelant détenteur de `_lock`).
+
+        Les conteneurs modifiés par les enregistrements sont recopiés pour
+        que l'encodage puisse se faire hors du verrou.
+        """
+        stats = self.stats
+        snapshot = dict(stats)
+        snapshot['sessions'] = list(stats['sessions'])
+        snapshot['hourly_distribution'] = list(stats['hourly_distribution'])
+        snapshot['patterns_used'] = dict(stats['patterns_used'])
+
+        daily_stats = dict(self._unparsed_daily_stats)
+        daily_stats.update(
+            (_date_key_to_str(key), dict(day_stats))
+            for key, day_stats in stats['daily_stats'].items()
+        )
+        snapshot['daily_stats'] = daily_stats
+        return snapshot
+
+    def flush(self) -> bool:
+        """
+        Écrit les statistiques sur disque si elles ont été modifiées.
+
+        Returns:
+            True si rien n'était en attente ou si l'écriture a réussi.
+        """
+        if not self._dirty:
             return True
-        except IOError as e:
-            logging.error(f"Erreur lors de la sauvegarde des stats: {e}")
-            return False
+        return self.save_stats()
+
+    def _flush_loop(self) -> None:
+        """Boucle d'écriture différée des statistiques."""
+        while True:
+            time.sleep(self.FLUSH_INTERVAL)
+            self.flush()
 
     def record_click(
         self,
@@ -101,44 +206,45 @@ class StatsManager:
             pattern: Pattern comportemental utilisé.
             success: True si le clic a été réussi.
         """
-        self.stats['total_clicks'] += 1
-
-        if success:
-            self.stats['total_fish'] += 1
-
-        # Mise à jour de la moyenne de temps de réaction
-        current_avg = self.stats.get('average_reaction_time', 0)
-        n = self.stats['total_clicks']
-        self.stats['average_reaction_time'] = \
-            (current_avg * (n - 1) + reaction_time) / n
-
-        # Enregistrer le pattern utilisé
-        if pattern not in self.stats['patterns_used']:
-            self.stats['patterns_used'][pattern] = 0
-        self.stats['patterns_used'][pattern] += 1
-
-        # Distribution horaire
-        hour = datetime.now().hour
-        self.stats['hourly_distribution'][hour] += 1
-
-        # Stats quotidiennes
-        today = datetime.now().strftime('%Y-%m-%d')
-        if today not in self.stats['daily_stats']:
-            self.stats['daily_stats'][today] = {
-                'clicks': 0,
-                'fish': 0,
-                'runtime': 0
-            }
-        self.stats['daily_stats'][today]['clicks'] += 1
-        if success:
-            self.stats['daily_stats'][today]['fish'] += 1
+        now = datetime.now()
+        hour = now.hour
+        today = _date_key(now)
 
-        # Mise à jour du taux de succès
-        if self.stats['total_clicks'] > 0:
-            self.stats['success_rate'] = \
-                (self.stats['total_fish'] / self.stats['total_clicks']) * 100
+        with self._lock:
+            stats = self.stats
 
-        self.save_stats()
+            n = stats['total_clicks'] + 1
+            stats['total_clicks'] = n
+
+            fish = stats['total_fish']
+            if success:
+                fish += 1
+                stats['total_fish'] = fish
+
+            # Moyenne glissante du temps de réaction (mise à jour de Welford)
+            current_avg = stats.get('average_reaction_time', 0)
+            stats['average_reaction_time'] = current_avg + (reaction_time - current_avg) / n
+
+            # Enregistrer le pattern utilisé
+            patterns_used = stats['patterns_used']
+            patterns_used[pattern] = patterns_used.get(pattern, 0) + 1
+
+            # Distribution horaire
+            stats['hourly_distribution'][hour] += 1
+
+            # Stats quotidiennes
+            daily = stats['daily_stats'].get(today)
+            if daily is None:
+                daily = {'clicks': 0, 'fish': 0, 'runtime': 0}
+                stats['daily_stats'][today] = daily
+            daily['clicks'] += 1
+            if success:
+                daily['fish'] += 1
+
+            # Mise à jour du taux de succès
+            stats['success_rate'] = (fish / n) * 100
+
+            self._dirty = True
 
     def get_session_stats(self) -> Dict[str, Any]:
         """
@@ -147,19 +253,20 @@ class StatsManager:
         Returns:
             Dictionnaire avec les stats de session.
         """
-        success_rate = 0.0
-        if self.stats['total_clicks'] > 0:
-            success_rate = \
-                (self.stats['total_fish'] / self.stats['total_clicks']) * 100
-
-        return {
-            'clicks': self.stats['total_clicks'],
-            'fish': self.stats['total_fish'],
-            'success_rate': success_rate,
-            'avg_reaction': self.stats['average_reaction_time'],
-            'best_hour': self.get_best_hour(),
-            'most_used_pattern': self.get_most_used_pattern()
-        }
+        with self._lock:
+            stats = self.stats
+            success_rate = 0.0
+            if stats['total_clicks'] > 0:
+                success_rate = (stats['total_fish'] / stats['total_clicks']) * 100
+
+            return {
+                'clicks': stats['total_clicks'],
+                'fish': stats['total_fish'],
+                'success_rate': success_rate,
+                'avg_reaction': stats['average_reaction_time'],
+                'best_hour': self._best_hour(),
+                'most_used_pattern': self._most_used_pattern()
+            }
 
     def get_best_hour(self) -> str:
         """
@@ -168,12 +275,16 @@ class StatsManager:
         Returns:
             Chaîne décrivant l'heure la plus productive.
         """
-        if not any(self.stats['hourly_distribution']):
+        with self._lock:
+            return self._best_hour()
+
+    def _best_hour(self) -> str:
+        """Implémentation de `get_best_hour` (appelant détenteur de `_lock`)."""
+        distribution = self.stats['hourly_distribution']
+        if not any(distribution):
             return "N/A"
 
-        best_hour = self.stats['hourly_distribution'].index(
-            max(self.stats['hourly_distribution'])
-        )
+        best_hour = distribution.index(max(distribution))
         return f"{best_hour}h-{best_hour + 1}h"
 
     def get_most_used_pattern(self) -> str:
@@ -183,13 +294,16 @@ class StatsManager:
         Returns:
             Nom du pattern le plus utilisé ou "N/A".
         """
-        if not self.stats['patterns_used']:
+        with self._lock:
+            return self._most_used_pattern()
+
+    def _most_used_pattern(self) -> str:
+        """Implémentation de `get_most_used_pattern` (appelant détenteur de `_lock`)."""
+        patterns_used = self.stats['patterns_used']
+        if not patterns_used:
             return "N/A"
 
-        return max(
-            self.stats['patterns_used'],
-            key=self.stats['patterns_used'].get
-        )
+        return max(patterns_used, key=patterns_used.get)
 
     def get_daily_summary(self, date: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -201,17 +315,23 @@ class StatsManager:
         Returns:
             Statistiques de la journée.
         """
-        if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+        default = {'clicks': 0, 'fish': 0, 'runtime': 0}
 
-        if date in self.stats['daily_stats']:
-            return self.stats['daily_stats'][date]
+        if date is None:
+            key = _date_key(datetime.now())
+        else:
+            try:
+                key = _date_str_to_key(date)
+            except ValueError:
+                return default
 
-        return {'clicks': 0, 'fish': 0, 'runtime': 0}
+        return self.stats['daily_stats'].get(key, default)
 
     def reset_stats(self) -> None:
         """Réinitialise toutes les statistiques."""
-        self.stats = self._default_stats()
+        with self._lock:
+            self.stats = self._default_stats()
+            self._unparsed_daily_stats = {}
         self.save_stats()
         logging.info("Statistiques réinitialisées")
 
@@ -222,8 +342,10 @@ class StatsManager:
         Args:
             seconds: Nombre de secondes à ajouter.
         """
-        self.stats['total_runtime'] += seconds
+        today = _date_key(datetime.now())
 
-        today = datetime.now().strftime('%Y-%m-%d')
-        if today in self.stats['daily_stats']:
-            self.stats['daily_stats'][today]['runtime'] += seconds
+        with self._lock:
+            self.stats['total_runtime'] += seconds
+            if today in self.stats['daily_stats']:
+                self.stats['daily_stats'][today]['runtime'] += seconds
+            self._dirty = True
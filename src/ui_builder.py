@@ -2,6 +2,7 @@
 AutoFish Minecraft - Constructeur d'interface utilisateur.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Dict, Any, TYPE_CHECKING
@@ -19,6 +20,21 @@ class UIBuilder:
     Separe la logique de creation des widgets de la logique metier.
     """
 
+    # Lignes de la section statistiques (cle, libelle)
+    STATS_FIELDS = (
+        ('fish', "Poissons peches"),
+        ('session_time', "Temps session"),
+        ('rate', "Taux actuel"),
+        ('success_rate', "Taux succes"),
+        ('best_hour', "Meilleure heure"),
+        ('pattern', "Pattern favori"),
+        ('avg_reaction', "Reaction moy"),
+        ('total_clicks', "Total historique"),
+    )
+
+    # Intervalle minimal entre deux mises a jour du libelle de niveau (5 Hz)
+    LEVEL_LABEL_INTERVAL = 0.2
+
     def __init__(self, parent: tk.Tk, state: 'AppState', callbacks: Dict[str, Callable]):
         """
         Initialise le constructeur d'interface.
@@ -35,9 +51,12 @@ class UIBuilder:
         # Variables Tkinter
         self.app_var = tk.StringVar()
         self.current_level_var = tk.StringVar(value="Niveau: 0.0")
-        self.delay_display_var = tk.StringVar(
-            value=f"{state.detection.min_delay:.2f} - {state.detection.max_delay:.2f}s"
-        )
+        self._level_label_time = 0.0
+        # Dernier niveau recu et mise a jour differee du libelle
+        self._pending_level = 0.0
+        self._level_label_job = None
+        self._delay_text = f"{state.detection.min_delay:.2f} - {state.detection.max_delay:.2f}s"
+        self.delay_display_var = tk.StringVar(value=self._delay_text)
 
         # Variables d'affichage liees a l'etat
         self.show_delay = tk.BooleanVar(value=state.display.show_delay)
@@ -55,21 +74,46 @@ class UIBuilder:
         self.max_delay_scale = None
         self.inactivity_scale = None
         self.inactivity_label = None
-        self.stats_text = None
+        self.stats_vars: Dict[str, tk.StringVar] = {}
+        self._stats_values: Dict[str, str] = {}
         self.profile_label = None
+        self._profile_text = ""
         self.calibration_button = None
         self.boost_button = None
 
+        # Onglets construits a leur premiere selection (chemin Tk -> constructeur)
+        self._lazy_tabs: Dict[str, Callable[[tk.Frame], None]] = {}
+
     def build(self):
         """Construit l'interface complete."""
         notebook = ttk.Notebook(self.parent)
         notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         self._create_main_tab(notebook)
-        self._create_profiles_tab(notebook)
-        self._create_options_tab(notebook)
+        self._add_lazy_tab(notebook, "Profils", self._create_profiles_tab)
+        self._add_lazy_tab(notebook, "Options", self._create_options_tab)
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         self._create_info_bar()
 
+    def _add_lazy_tab(
+        self,
+        notebook: ttk.Notebook,
+        text: str,
+        builder: Callable[[tk.Frame], None]
+    ):
+        """Ajoute un onglet vide dont le contenu sera cree a la premiere selection."""
+        tab = tk.Frame(notebook, bg='#f0f0f0')
+        notebook.add(tab, text=text)
+        self._lazy_tabs[str(tab)] = builder
+
+    def _on_tab_changed(self, event):
+        """Construit le contenu de l'onglet selectionne s'il ne l'est pas encore."""
+        notebook = event.widget
+        tab = notebook.select()
+        builder = self._lazy_tabs.pop(tab, None)
+        if builder:
+            builder(notebook.nametowidget(tab))
+
     def _create_main_tab(self, notebook: ttk.Notebook):
         """Cree l'onglet principal."""
         main_tab = tk.Frame(notebook, bg='#f0f0f0')
@@ -118,6 +162,7 @@ class UIBuilder:
         volume_frame.pack(fill=tk.X, padx=5, pady=3)
 
         self.volume_graph = VolumeGraphBar(volume_frame)
+        self.volume_graph.set_threshold(self.state.detection.threshold)
         self.volume_graph.pack(pady=3)
 
         tk.Label(
@@ -144,8 +189,9 @@ class UIBuilder:
         self.threshold_scale.set(self.state.detection.threshold)
         self.threshold_scale.pack(side=tk.LEFT, padx=3)
 
+        self._threshold_text = f"{self.state.detection.threshold:.1f}"
         self.threshold_label = tk.Label(
-            threshold_frame, text=f"{self.state.detection.threshold:.1f}",
+            threshold_frame, text=self._threshold_text,
             font=('Arial', 9, 'bold'), bg='#f0f0f0'
         )
         self.threshold_label.pack(side=tk.LEFT)
@@ -207,9 +253,10 @@ class UIBuilder:
         self.inactivity_scale.set(self.state.inactivity.base_delay)
         self.inactivity_scale.pack(side=tk.LEFT, padx=3)
 
+        self._inactivity_text = f"{self.state.inactivity.base_delay}s (+/-2s)"
         self.inactivity_label = tk.Label(
             inactivity_frame,
-            text=f"{self.state.inactivity.base_delay}s (+/-2s)",
+            text=self._inactivity_text,
             font=('Arial', 9, 'bold'), bg='#f0f0f0'
         )
         self.inactivity_label.pack(side=tk.LEFT)
@@ -222,17 +269,26 @@ class UIBuilder:
         )
         stats_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=3)
 
-        self.stats_text = tk.Text(
-            stats_frame, height=8, width=50, bg='#ffffff',
-            font=('Consolas', 8), relief=tk.FLAT, borderwidth=1
-        )
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        stats_grid = tk.Frame(stats_frame, bg='#ffffff')
+        stats_grid.pack(fill=tk.BOTH, expand=True)
+
+        for row, (key, label) in enumerate(self.STATS_FIELDS):
+            tk.Label(
+                stats_grid, text=f"{label}:",
+                font=('Consolas', 8), bg='#ffffff'
+            ).grid(row=row, column=0, sticky='w', padx=(5, 10))
+
+            var = tk.StringVar()
+            tk.Label(
+                stats_grid, textvariable=var,
+                font=('Consolas', 8, 'bold'), bg='#ffffff'
+            ).grid(row=row, column=1, sticky='w')
 
-    def _create_profiles_tab(self, notebook: ttk.Notebook):
-        """Cree l'onglet des profils."""
-        profiles_tab = tk.Frame(notebook, bg='#f0f0f0')
-        notebook.add(profiles_tab, text="Profils")
+            self.stats_vars[key] = var
+            self._stats_values[key] = ""
 
+    def _create_profiles_tab(self, profiles_tab: tk.Frame):
+        """Cree le contenu de l'onglet des profils."""
         self.calibration_button = tk.Button(
             profiles_tab, text="AUTO-CALIBRATION",
             command=self.callbacks['start_calibration'],
@@ -248,7 +304,7 @@ class UIBuilder:
         current_frame.pack(fill=tk.X, padx=10, pady=10)
 
         self.profile_label = tk.Label(
-            current_frame, text="", font=('Arial', 9), bg='#f0f0f0'
+            current_frame, text=self._profile_text, font=('Arial', 9), bg='#f0f0f0'
         )
         self.profile_label.pack(pady=10)
 
@@ -274,11 +330,8 @@ class UIBuilder:
                 bg=color, fg='white', width=12, height=2, font=('Arial', 9)
             ).pack(side=tk.LEFT, padx=5)
 
-    def _create_options_tab(self, notebook: ttk.Notebook):
-        """Cree l'onglet des options."""
-        options_tab = tk.Frame(notebook, bg='#f0f0f0')
-        notebook.add(options_tab, text="Options")
-
+    def _create_options_tab(self, options_tab: tk.Frame):
+        """Cree le contenu de l'onglet des options."""
         display_frame = tk.LabelFrame(
             options_tab, text="Affichage",
             font=('Arial', 9, 'bold'), bg='#f0f0f0', padx=5, pady=5
@@ -314,7 +367,7 @@ class UIBuilder:
             values=get_color_list(), width=12, state='readonly'
         )
         color_combo.pack(side=tk.LEFT, padx=5)
-        color_combo.bind('<<ComboboxSelected>>', lambda e: self._sync_display_options())
+        color_combo.bind('<<ComboboxSelected>>', lambda e: self._on_text_color_selected())
 
         action_frame = tk.Frame(options_tab, bg='#f0f0f0')
         action_frame.pack(fill=tk.X, padx=5, pady=10)
@@ -357,32 +410,93 @@ class UIBuilder:
         self.state.display.show_click_counter = self.show_click_counter.get()
         self.state.display.show_rate = self.show_rate.get()
         self.state.display.text_color = self.text_color_var.get()
+        self.state.update_display_format()
 
         if 'save_config' in self.callbacks:
             self.callbacks['save_config']()
 
+    def _on_text_color_selected(self):
+        """Applique la nouvelle couleur de texte a l'overlay."""
+        self._sync_display_options()
+
+        if 'update_text_color' in self.callbacks:
+            self.callbacks['update_text_color']()
+
     def update_apps_list(self, apps: list):
         """Met a jour la liste des applications."""
         self.app_combo['values'] = apps
 
-    def update_volume_display(self, level: float):
-        """Met a jour l'affichage du niveau de volume."""
-        self.current_level_var.set(f"Niveau: {level:.1f}")
-        self.volume_graph.add_value(level)
+    def add_volume_samples(self, levels: list):
+        """
+        Ajoute un lot de niveaux au graphique et affiche le dernier.
+
+        Le libelle de niveau est limite a LEVEL_LABEL_INTERVAL; un niveau
+        arrive trop tot est affiche par une mise a jour differee, pour que
+        le libelle montre toujours le dernier niveau quand les echantillons
+        s'arretent. Le graphique recoit tous les echantillons (ecriture dans
+        son tampon circulaire).
+        """
+        for level in levels:
+            self.volume_graph.add_value(level)
+
+        self._pending_level = levels[-1]
+        if self._level_label_job is not None:
+            return
+
+        elapsed = time.monotonic() - self._level_label_time
+        if elapsed >= self.LEVEL_LABEL_INTERVAL:
+            self._update_level_label()
+        else:
+            delay_ms = int((self.LEVEL_LABEL_INTERVAL - elapsed) * 1000) + 1
+            self._level_label_job = self.parent.after(delay_ms, self._update_level_label)
+
+    def _update_level_label(self):
+        """Affiche le dernier niveau recu."""
+        self._level_label_job = None
+        self._level_label_time = time.monotonic()
+        self.current_level_var.set(f"Niveau: {self._pending_level:.1f}")
+
+    def update_stats_display(self, values: Dict[str, str]):
+        """Met a jour les lignes de statistiques dont la valeur a change."""
+        for key, value in values.items():
+            if self._stats_values.get(key) != value:
+                self._stats_values[key] = value
+                self.stats_vars[key].set(value)
 
     def update_threshold_display(self, value: float):
-        """Met a jour l'affichage du seuil."""
-        self.threshold_label.config(text=f"{value:.1f}")
+        """Met a jour l'affichage du seuil (ignore si le texte est inchange)."""
+        text = f"{value:.1f}"
+        if text == self._threshold_text:
+            return
+        self._threshold_text = text
+        self.threshold_label.config(text=text)
         self.volume_graph.set_threshold(value)
 
     def update_delay_display(self, min_val: float, max_val: float):
-        """Met a jour l'affichage des delais."""
-        self.delay_display_var.set(f"{min_val:.2f} - {max_val:.2f}s")
+        """Met a jour l'affichage des delais (ignore si le texte est inchange)."""
+        text = f"{min_val:.2f} - {max_val:.2f}s"
+        if text == self._delay_text:
+            return
+        self._delay_text = text
+        self.delay_display_var.set(text)
 
     def update_inactivity_display(self, value: int):
-        """Met a jour l'affichage de l'inactivite."""
-        self.inactivity_label.config(text=f"{value}s (+/-2s)")
+        """Met a jour l'affichage de l'inactivite (ignore si le texte est inchange)."""
+        text = f"{value}s (+/-2s)"
+        if text == self._inactivity_text:
+            return
+        self._inactivity_text = text
+        self.inactivity_label.config(text=text)
 
     def update_boost_button(self, is_boost: bool):
-        """Met a jour le bouton boost."""
-        self.boost_button.config(text=f"Boost: {'ON' if is_boost else 'OFF'}")
+        """Met a jour le bouton boost (si l'onglet Options est construit)."""
+        if self.boost_button:
+            self.boost_button.config(text=f"Boost: {'ON' if is_boost else 'OFF'}")
+
+    def update_profile_display(self, text: str):
+        """Met a jour le resume du profil (applique a la creation de l'onglet sinon)."""
+        if text == self._profile_text:
+            return
+        self._profile_text = text
+        if self.profile_label:
+            self.profile_label.config(text=text)
@@ -4,9 +4,11 @@ Contient les widgets graphiques réutilisables.
 """
 
 import tkinter as tk
-import collections
+from types import MappingProxyType
 from typing import Optional
 
+import numpy as np
+
 
 class VolumeGraphBar(tk.Canvas):
     """
@@ -14,8 +16,16 @@ class VolumeGraphBar(tk.Canvas):
 
     Affiche une courbe de volume avec une ligne de seuil
     et un remplissage sous la courbe.
+
+    Les éléments du canvas sont créés une seule fois puis déplacés via
+    `coords`; les nouvelles valeurs sont regroupées et redessinées
+    à cadence fixe par une boucle `after`. L'historique est un tampon
+    circulaire NumPy de taille fixe.
     """
 
+    # Intervalle de rafraîchissement du graphique (~30 Hz)
+    REFRESH_MS = 33
+
     def __init__(
         self,
         master: Optional[tk.Widget] = None,
@@ -45,7 +55,8 @@ class VolumeGraphBar(tk.Canvas):
         self._width = width
         self._height = height
         self._history_size = history_size
-        self.history = collections.deque([0] * history_size, maxlen=history_size)
+        self._buffer = np.zeros(history_size, dtype=np.float32)
+        self._write_index = 0
         self.threshold_value = 8.0
 
         # Couleurs
@@ -54,17 +65,74 @@ class VolumeGraphBar(tk.Canvas):
         self.threshold_color = '#ff6666'
         self.grid_color = '#f0f0f0'
 
+        self._dirty = True
+        self._render_job = None
+
+        # Coordonnées du polygone de remplissage: (0, h), courbe..., (w, h);
+        # la courbe est une vue sur la partie centrale du tableau
+        self._fill_points = np.empty(2 * history_size + 4, dtype=np.float32)
+        self._fill_points[0:2] = (0, height)
+        self._fill_points[-2:] = (width, height)
+        self._curve_points = self._fill_points[2:-2]
+        self._curve_points[0::2] = np.arange(history_size) * (width / max(history_size - 1, 1))
+
+        self._create_items()
         self.draw()
+        self._render_job = self.after(self.REFRESH_MS, self._render_loop)
+
+    def _create_items(self) -> None:
+        """Crée une fois pour toutes les éléments du canvas."""
+        # Grille de fond
+        grid_spacing = self._height // 5
+        for i in range(5):
+            y = i * grid_spacing
+            self.create_line(
+                0, y, self._width, y,
+                fill=self.grid_color,
+                width=1
+            )
+
+        # Ligne de seuil
+        self._threshold_id = self.create_line(
+            0, 0, self._width, 0,
+            fill=self.threshold_color,
+            width=2,
+            dash=(5, 2)
+        )
+
+        # Courbe principale
+        self._curve_id = self.create_line(
+            0, self._height, self._width, self._height,
+            fill=self.line_color,
+            width=2,
+            smooth=True
+        )
+
+        # Zone de remplissage sous la courbe
+        self._fill_id = self.create_polygon(
+            0, self._height, self._width, self._height,
+            fill=self.fill_color,
+            stipple='gray50',
+            outline=''
+        )
 
     def add_value(self, value: float) -> None:
         """
-        Ajoute une valeur à l'historique et redessine.
+        Ajoute une valeur à l'historique.
+
+        Le redessin est effectué au prochain rafraîchissement.
 
         Args:
             value: Valeur de volume (0-10).
         """
-        self.history.append(value)
-        self.draw()
+        self._buffer[self._write_index] = value
+        self._write_index = (self._write_index + 1) % self._history_size
+        self._dirty = True
+
+    @property
+    def history(self) -> np.ndarray:
+        """Historique des valeurs, de la plus ancienne à la plus récente."""
+        return np.roll(self._buffer, -self._write_index)
 
     def set_threshold(self, threshold: float) -> None:
         """
@@ -74,83 +142,54 @@ class VolumeGraphBar(tk.Canvas):
             threshold: Nouvelle valeur de seuil (0-10).
         """
         self.threshold_value = threshold
-        self.draw()
+        self._draw_threshold()
+
+    def _render_loop(self) -> None:
+        """Redessine la courbe si des valeurs ont été ajoutées."""
+        if self._dirty:
+            self._dirty = False
+            self._draw_volume_curve()
+        self._render_job = self.after(self.REFRESH_MS, self._render_loop)
 
     def draw(self) -> None:
         """Dessine le graphique complet."""
-        self.delete("all")
-
-        # Grille de fond
-        self._draw_grid()
-
         # Ligne de seuil
         self._draw_threshold()
 
         # Courbe de volume
         self._draw_volume_curve()
 
-    def _draw_grid(self) -> None:
-        """Dessine la grille de fond."""
-        grid_spacing = self._height // 5
-        for i in range(5):
-            y = i * grid_spacing
-            self.create_line(
-                0, y, self._width, y,
-                fill=self.grid_color,
-                width=1
-            )
-
     def _draw_threshold(self) -> None:
-        """Dessine la ligne de seuil."""
+        """Positionne la ligne de seuil."""
         threshold_y = self._height - (self.threshold_value * self._height / 10)
-        self.create_line(
-            0, threshold_y, self._width, threshold_y,
-            fill=self.threshold_color,
-            width=2,
-            dash=(5, 2)
-        )
+        self.coords(self._threshold_id, 0, threshold_y, self._width, threshold_y)
 
     def _draw_volume_curve(self) -> None:
-        """Dessine la courbe de volume."""
-        if len(self.history) < 2:
+        """Met à jour la courbe de volume."""
+        if self._history_size < 2:
             return
 
-        # Calculer les points
-        points = []
-        point_spacing = self._width / (self._history_size - 1)
-
-        for i, value in enumerate(self.history):
-            x = i * point_spacing
-            y = self._height - (value * self._height / 10)
-            points.extend([x, y])
-
-        if len(points) < 4:
-            return
+        # Recopier le tampon circulaire dans l'ordre chronologique,
+        # puis convertir en ordonnées sur place
+        ys = self._curve_points[1::2]
+        w = self._write_index
+        k = self._history_size - w
+        ys[:k] = self._buffer[w:]
+        ys[k:] = self._buffer[:w]
+        ys *= -(self._height / 10)
+        ys += self._height
 
         # Courbe principale
-        self.create_line(
-            points,
-            fill=self.line_color,
-            width=2,
-            smooth=True
-        )
+        self.coords(self._curve_id, self._curve_points.tolist())
 
         # Zone de remplissage sous la courbe
-        fill_points = [0, self._height] + points + [self._width, self._height]
-        self.create_polygon(
-            fill_points,
-            fill=self.fill_color,
-            stipple='gray50',
-            outline=''
-        )
+        self.coords(self._fill_id, self._fill_points.tolist())
 
     def clear(self) -> None:
         """Efface l'historique."""
-        self.history = collections.deque(
-            [0] * self._history_size,
-            maxlen=self._history_size
-        )
-        self.draw()
+        self._buffer.fill(0)
+        self._write_index = 0
+        self._dirty = True
 
     def set_colors(
         self,
@@ -168,11 +207,19 @@ class VolumeGraphBar(tk.Canvas):
         """
         if line_color:
             self.line_color = line_color
+            self.itemconfig(self._curve_id, fill=line_color)
         if fill_color:
             self.fill_color = fill_color
+            self.itemconfig(self._fill_id, fill=fill_color)
         if threshold_color:
             self.threshold_color = threshold_color
-        self.draw()
+            self.itemconfig(self._threshold_id, fill=threshold_color)
+
+    def destroy(self) -> None:
+        """Détruit le graphique proprement."""
+        if self._render_job:
+            self.after_cancel(self._render_job)
+        super().destroy()
 
 
 class PixelIndicator(tk.Toplevel):
@@ -212,7 +259,6 @@ class PixelIndicator(tk.Toplevel):
         self._position = position
         self._on_click = on_click
         self._current_status = 'paused'
-        self._keep_on_top_job = None
 
         # Configuration de la fenêtre
         self.overrideredirect(True)
@@ -225,8 +271,9 @@ class PixelIndicator(tk.Toplevel):
         if on_click:
             self.bind("<Button-1>", lambda e: on_click())
 
-        # Démarrer le maintien au premier plan
-        self._keep_on_top()
+        # Remise au premier plan uniquement quand le système masque la fenêtre
+        self.bind("<Visibility>", self._keep_on_top)
+        self.bind("<FocusOut>", self._keep_on_top)
 
     def set_status(self, status: str) -> None:
         """
@@ -248,18 +295,11 @@ class PixelIndicator(tk.Toplevel):
         """
         return self._current_status
 
-    def _keep_on_top(self) -> None:
-        """Force l'indicateur à rester au premier plan."""
+    def _keep_on_top(self, event=None) -> None:
+        """Remet l'indicateur au premier plan."""
         if self.winfo_exists():
             self.attributes("-topmost", True)
             self.lift()
-            self._keep_on_top_job = self.after(1000, self._keep_on_top)
-
-    def destroy(self) -> None:
-        """Détruit l'indicateur proprement."""
-        if self._keep_on_top_job:
-            self.after_cancel(self._keep_on_top_job)
-        super().destroy()
 
 
 class TransparentLabel(tk.Toplevel):
@@ -291,7 +331,6 @@ class TransparentLabel(tk.Toplevel):
         super().__init__(master)
 
         self._position = position
-        self._keep_on_top_job = None
 
         # Configuration de la fenêtre
         self.overrideredirect(True)
@@ -315,8 +354,9 @@ class TransparentLabel(tk.Toplevel):
         )
         self.label.pack()
 
-        # Démarrer le maintien au premier plan
-        self._keep_on_top()
+        # Remise au premier plan uniquement quand le système masque la fenêtre
+        self.bind("<Visibility>", self._keep_on_top)
+        self.bind("<FocusOut>", self._keep_on_top)
 
     def set_color(self, color: str) -> None:
         """
@@ -327,22 +367,15 @@ class TransparentLabel(tk.Toplevel):
         """
         self.label.config(fg=color)
 
-    def _keep_on_top(self) -> None:
-        """Force le label à rester au premier plan."""
+    def _keep_on_top(self, event=None) -> None:
+        """Remet le label au premier plan."""
         if self.winfo_exists():
             self.attributes("-topmost", True)
             self.lift()
-            self._keep_on_top_job = self.after(1000, self._keep_on_top)
-
-    def destroy(self) -> None:
-        """Détruit le label proprement."""
-        if self._keep_on_top_job:
-            self.after_cancel(self._keep_on_top_job)
-        super().destroy()
 
 
-# Mapping des couleurs françaises vers les couleurs tkinter
-COLORS_MAP = {
+# Mapping des couleurs françaises vers les couleurs tkinter (lecture seule)
+COLORS_MAP = MappingProxyType({
     "Rouge": "red",
     "Vert": "green",
     "Bleu": "blue",
@@ -355,7 +388,7 @@ COLORS_MAP = {
     "Marron": "brown",
     "Gris": "grey",
     "Blanc": "white"
-}
+})
 
 
 def get_color_list() -> list:
@@ -378,4 +411,7 @@ def translate_color(french_name: str) -> str:
     Returns:
         Nom de la couleur pour tkinter.
     """
-    return COLORS_MAP.get(french_name, "lime")
+    try:
+        return COLORS_MAP[french_name]
+    except KeyError:
+        return "lime"
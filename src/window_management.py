@@ -3,25 +3,61 @@ Module de gestion des fenêtres Windows.
 Gère l'interaction avec les fenêtres des applications via l'API Windows.
 """
 
+import time
 import logging
 import psutil
+import win32api
 import win32gui
 import win32con
 import win32process
 
+# Durées de validité des caches (secondes)
+HWND_CACHE_TTL = 2.0
+FOREGROUND_CACHE_TTL = 0.1
+
+# Correspondance PID -> handles de fenêtre, construite en un seul EnumWindows
+_hwnd_cache: dict = {}
+_hwnd_cache_time: float = 0.0
+
+# Cache nom de processus (minuscules) -> PID
+_pid_cache: dict = {}
+
+# Dernier PID au premier plan observé
+_foreground_pid: int = 0
+_foreground_time: float = 0.0
+
 
 def get_process_id_by_name(process_name: str) -> int:
     """
     Récupère le PID d'un processus à partir de son nom.
 
+    Le dernier PID trouvé est mis en cache et revalidé à chaque appel;
+    la liste complète des processus n'est parcourue qu'en cas d'échec.
+
     Args:
         process_name: Nom du processus (ex: "javaw.exe").
 
     Returns:
         PID du processus ou None si non trouvé.
     """
+    if not process_name:
+        return None
+
+    target = process_name.lower()
+
+    cached_pid = _pid_cache.get(target)
+    if cached_pid is not None:
+        try:
+            if psutil.Process(cached_pid).name().lower() == target:
+                return cached_pid
+        except psutil.Error:
+            pass
+        _pid_cache.pop(target, None)
+
     for proc in psutil.process_iter(['pid', 'name']):
-        if proc.info['name'] and proc.info['name'].lower() == process_name.lower():
+        name = proc.info['name']
+        if name and name.lower() == target:
+            _pid_cache[target] = proc.info['pid']
             return proc.info['pid']
     return None
 
@@ -36,31 +72,60 @@ def is_application_in_foreground(pid: int) -> bool:
     Returns:
         True si l'application est au premier plan, False sinon.
     """
-    foreground_window = win32gui.GetForegroundWindow()
-    _, foreground_pid = win32process.GetWindowThreadProcessId(foreground_window)
-    return foreground_pid == pid
+    global _foreground_pid, _foreground_time
+
+    now = time.monotonic()
+    if now - _foreground_time >= FOREGROUND_CACHE_TTL:
+        foreground_window = win32gui.GetForegroundWindow()
+        _, _foreground_pid = win32process.GetWindowThreadProcessId(foreground_window)
+        _foreground_time = now
+    return _foreground_pid == pid
+
+
+def _build_hwnd_map() -> dict:
+    """
+    Construit la correspondance PID -> handles en une seule énumération.
+
+    Returns:
+        Dictionnaire {pid: [hwnd, ...]} des fenêtres visibles et actives.
+    """
+    def callback(hwnd, hwnd_map):
+        if win32gui.IsWindowVisible(hwnd) and win32gui.IsWindowEnabled(hwnd):
+            _, found_pid = win32process.GetWindowThreadProcessId(hwnd)
+            hwnd_map.setdefault(found_pid, []).append(hwnd)
+        return True
+
+    hwnd_map = {}
+    win32gui.EnumWindows(callback, hwnd_map)
+    return hwnd_map
+
+
+def invalidate_hwnd_cache() -> None:
+    """Force la reconstruction de la correspondance PID -> handles."""
+    global _hwnd_cache_time
+    _hwnd_cache_time = 0.0
 
 
 def get_hwnds_for_pid(pid: int) -> list:
     """
     Récupère les handles de fenêtre pour un PID donné.
 
+    La correspondance de tous les PID est mise en cache pendant
+    `HWND_CACHE_TTL` secondes.
+
     Args:
         pid: PID du processus.
 
     Returns:
         Liste des handles de fenêtre visibles et actifs.
     """
-    def callback(hwnd, hwnds):
-        if win32gui.IsWindowVisible(hwnd) and win32gui.IsWindowEnabled(hwnd):
-            _, found_pid = win32process.GetWindowThreadProcessId(hwnd)
-            if found_pid == pid:
-                hwnds.append(hwnd)
-        return True
+    global _hwnd_cache, _hwnd_cache_time
 
-    hwnds = []
-    win32gui.EnumWindows(callback, hwnds)
-    return hwnds
+    now = time.monotonic()
+    if not _hwnd_cache_time or now - _hwnd_cache_time >= HWND_CACHE_TTL:
+        _hwnd_cache = _build_hwnd_map()
+        _hwnd_cache_time = now
+    return list(_hwnd_cache.get(pid, ()))
 
 
 def bring_window_to_front(pid: int) -> bool:
@@ -74,6 +139,7 @@ def bring_window_to_front(pid: int) -> bool:
         True si réussi, False sinon.
     """
     try:
+        invalidate_hwnd_cache()
         hwnds = get_hwnds_for_pid(pid)
         if hwnds:
             hwnd = hwnds[0]
@@ -115,3 +181,24 @@ def get_window_center(hwnd: int) -> tuple:
     center_x = (rect[2] - rect[0]) // 2
     center_y = (rect[3] - rect[1]) // 2
     return center_x, center_y
+
+
+def raise_current_thread_priority() -> bool:
+    """
+    Passe le thread appelant en priorité « au-dessus de la normale ».
+
+    Utilisé par le thread de surveillance audio pour limiter la dérive
+    de sa cadence d'échantillonnage quand la machine est chargée.
+
+    Returns:
+        True si la priorité a été modifiée, False sinon.
+    """
+    try:
+        win32process.SetThreadPriority(
+            win32api.GetCurrentThread(),
+            win32con.THREAD_PRIORITY_ABOVE_NORMAL
+        )
+        return True
+    except Exception as e:
+        logging.warning(f"Impossible de modifier la priorité du thread: {e}")
+        return False
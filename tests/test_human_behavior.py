@@ -0,0 +1,51 @@
+"""
+Tests du profil humain (HumanProfile) et du generateur de delais.
+"""
+
+import copy
+import pickle
+import unittest
+
+from src.human_behavior import HumanProfile, HumanLikeRandomizer, FLAG_BOOST
+
+
+class HumanProfileTest(unittest.TestCase):
+    """Verifie l'immuabilite et la copie des profils."""
+
+    def setUp(self):
+        self.profile = HumanProfile("Fast", 1.5, 0.7, 0.3, 0.8, 0.3)
+
+    def test_copy_round_trip(self):
+        for clone in (copy.copy(self.profile), copy.deepcopy(self.profile)):
+            self.assertEqual(clone, self.profile)
+            self.assertEqual(hash(clone), hash(self.profile))
+
+    def test_pickle_round_trip(self):
+        clone = pickle.loads(pickle.dumps(self.profile))
+        self.assertEqual(clone, self.profile)
+        self.assertEqual(clone.to_dict(), self.profile.to_dict())
+
+    def test_profile_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.profile.name = "Slow"
+
+
+class HumanizedDelaysBatchTest(unittest.TestCase):
+    """Verifie la generation de delais par lot."""
+
+    def setUp(self):
+        self.randomizer = HumanLikeRandomizer(HumanProfile("Normal", 1.0, 0.5, 0.5, 0.6, 0.5))
+
+    def test_batch_length_and_action_count(self):
+        delays = self.randomizer.get_humanized_delays_batch(0.1, 1.5, 20)
+        self.assertEqual(len(delays), 20)
+        self.assertEqual(self.randomizer.action_count, 20)
+
+    def test_batch_delays_are_positive(self):
+        for flags in (0, FLAG_BOOST):
+            delays = self.randomizer.get_humanized_delays_batch(0.1, 1.5, 50, flags)
+            self.assertTrue(all(delay > 0 for delay in delays))
+
+
+if __name__ == "__main__":
+    unittest.main()